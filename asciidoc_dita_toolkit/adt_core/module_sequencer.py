@@ -6,10 +6,12 @@ Handles plugin discovery, dependency resolution, configuration management,
 and proper initialization sequencing.
 """
 
+import functools
 import json
 import logging
 import os
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Set, Tuple, Optional, Any
@@ -28,6 +30,23 @@ from .exceptions import (
 LEGACY_PLUGINS = set()  # All plugins have been migrated to ADTModule
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_adt_entry_points() -> tuple:
+    """
+    Return the installed 'adt.modules' entry points.
+
+    Scanning package metadata is slow and its result does not change while
+    the process runs, so the scan happens once. Call ``cache_clear()`` after
+    installing plugins at runtime or when patching ``entry_points`` in tests.
+    """
+    eps = entry_points()
+    return tuple(
+        eps.select(group="adt.modules")
+        if hasattr(eps, 'select')
+        else eps.get("adt.modules", [])
+    )
+
+
 class ModuleState(Enum):
     """Possible states for a module."""
 
@@ -170,14 +189,7 @@ class ModuleSequencer:
 
         try:
             # Discover modules via entry points
-            eps = entry_points()
-            adt_eps = (
-                eps.select(group="adt.modules")
-                if hasattr(eps, 'select')
-                else eps.get("adt.modules", [])
-            )
-
-            for entry_point in adt_eps:
+            for entry_point in _cached_adt_entry_points():
                 try:
                     module_class = entry_point.load()
                     module_instance = module_class()
@@ -226,16 +238,14 @@ class ModuleSequencer:
             # Step 1: Build dependency graph
             dep_graph = self._build_dependency_graph()
 
-            # Step 2: Detect circular dependencies
-            self._detect_circular_dependencies(dep_graph)
-
-            # Step 3: Topological sort for initialization order
+            # Step 2: Topological sort for initialization order
+            # (raises CircularDependencyError if the graph has a cycle)
             sorted_modules = self._topological_sort(dep_graph)
 
-            # Step 4: Apply user preferences and CLI overrides
+            # Step 3: Apply user preferences and CLI overrides
             final_modules = self._apply_user_preferences(sorted_modules, cli_overrides)
 
-            # Step 5: Validate final configuration
+            # Step 4: Validate final configuration
             resolutions = self._validate_final_config(final_modules)
 
         except (
@@ -253,18 +263,16 @@ class ModuleSequencer:
         # Initialize graph with all modules
         graph = {}
         all_modules = set()
+        module_dependencies = []
 
         for module_config in self.dev_config.get("modules", []):
             module_name = module_config["name"]
             all_modules.add(module_name)
 
             # Combine module's own dependencies with developer-specified additional dependencies
-            module_deps = set()
+            all_dependencies = set(module_config.get("dependencies", []))
             if module_name in self.available_modules:
-                module_deps.update(self.available_modules[module_name].dependencies)
-
-            additional_deps = set(module_config.get("dependencies", []))
-            all_dependencies = module_deps.union(additional_deps)
+                all_dependencies.update(self.available_modules[module_name].dependencies)
 
             # Validate dependencies exist
             for dep in all_dependencies:
@@ -273,21 +281,14 @@ class ModuleSequencer:
                         f"Module '{module_name}' depends on missing module '{dep}'"
                     )
 
+            module_dependencies.append((module_name, all_dependencies))
+
         # Initialize all nodes in graph
         for module in all_modules:
             graph[module] = set()
 
         # Build adjacency list: if A depends on B, then B -> A
-        for module_config in self.dev_config.get("modules", []):
-            module_name = module_config["name"]
-
-            module_deps = set()
-            if module_name in self.available_modules:
-                module_deps.update(self.available_modules[module_name].dependencies)
-
-            additional_deps = set(module_config.get("dependencies", []))
-            all_dependencies = module_deps.union(additional_deps)
-
+        for module_name, all_dependencies in module_dependencies:
             # For each dependency, add an edge from dependency to this module
             for dep in all_dependencies:
                 graph[dep].add(module_name)
@@ -331,11 +332,11 @@ class ModuleSequencer:
                 in_degree[neighbor] = in_degree.get(neighbor, 0) + 1
 
         # Kahn's algorithm
-        queue = [node for node in in_degree if in_degree[node] == 0]
+        queue = deque(node for node in in_degree if in_degree[node] == 0)
         result = []
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
 
             for neighbor in graph.get(current, set()):
@@ -343,6 +344,17 @@ class ModuleSequencer:
                 if in_degree[neighbor] == 0:
                     queue.append(neighbor)
 
+        # Nodes that never reached in-degree 0 are on or behind a cycle;
+        # only then pay for the DFS that reports the cycle's path
+        if len(result) != len(in_degree):
+            remaining = sorted(node for node in in_degree if in_degree[node] > 0)
+            self._detect_circular_dependencies(
+                {node: graph.get(node, set()) for node in remaining}
+            )
+            raise CircularDependencyError(
+                f"Circular dependency detected among: {', '.join(remaining)}"
+            )
+
         return result
 
     def _apply_user_preferences(
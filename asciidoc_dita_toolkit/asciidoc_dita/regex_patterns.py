@@ -52,6 +52,10 @@ CONTEXT_ATTR_PATTERN = r'^:context:\s+(.+)$'
 # Uses positive lookbehind and lookahead to ensure proper include syntax
 INCLUDE_PATTERN = r'(?<=^include::)[^[]+(?=\[\])'
 
+# Combined ID-or-include pattern for single-pass line scanning
+# Captures: (id, None) for an ID attribute, (None, filename) for an include
+ID_OR_INCLUDE_PATTERN = r'\[id="([^"]+)"\]|^include::([^[]+)(?=\[\])'
+
 # =============================================================================
 # PRE-COMPILED PATTERNS
 # =============================================================================
@@ -77,6 +81,7 @@ class CompiledPatterns:
     # AsciiDoc structure patterns
     CONTEXT_ATTR_REGEX: Pattern = re.compile(CONTEXT_ATTR_PATTERN, re.MULTILINE)
     INCLUDE_REGEX: Pattern = re.compile(INCLUDE_PATTERN)
+    ID_OR_INCLUDE_REGEX: Pattern = re.compile(ID_OR_INCLUDE_PATTERN)
 
 
 # =============================================================================
@@ -124,6 +129,7 @@ def validate_patterns() -> bool:
         # Test structure patterns
         assert CompiledPatterns.CONTEXT_ATTR_REGEX.search(':context: test')
         assert CompiledPatterns.INCLUDE_REGEX.search('include::file.adoc[]')
+        assert CompiledPatterns.ID_OR_INCLUDE_REGEX.search('include::file.adoc[]')
 
         return True
 
@@ -205,6 +211,18 @@ PATTERN_EXAMPLES = {
             'include::file.adoc',
         ],
     },
+    'ID_OR_INCLUDE_PATTERN': {
+        'pattern': ID_OR_INCLUDE_PATTERN,
+        'description': 'Matches either an ID attribute or an include directive filename',
+        'examples': {
+            '[id="simple_id"]': 'Captures: (simple_id, None)',
+            'include::chapter1.adoc[]': 'Captures: (None, chapter1.adoc)',
+        },
+        'non_matches': [
+            'id="missing_brackets"',
+            'include::file.adoc[tag=part]',
+        ],
+    },
 }
 
 
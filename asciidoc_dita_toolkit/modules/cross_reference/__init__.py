@@ -18,7 +18,7 @@ import sys
 import logging
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, List, Optional, Set, TextIO, Tuple, Any
 
 
 from asciidoc_dita_toolkit.asciidoc_dita.file_utils import (
@@ -44,7 +44,7 @@ except ImportError as e:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BrokenXref:
     """Represents a broken cross-reference."""
 
@@ -56,7 +56,7 @@ class BrokenXref:
     reason: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class XrefFix:
     """Represents a fixed cross-reference."""
 
@@ -66,7 +66,7 @@ class XrefFix:
     new_xref: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationReport:
     """Comprehensive validation report for cross-references."""
 
@@ -453,14 +453,21 @@ class CrossReferenceProcessor:
     Enhanced with validation, migration awareness, and comprehensive reporting.
     """
 
-    def __init__(self, validation_only: bool = False, migration_mode: bool = False):
-        # Use shared regex patterns
-        self.id_regex = CompiledPatterns.ID_REGEX
-        self.include_regex = CompiledPatterns.INCLUDE_REGEX
-        self.xref_regex = (
-            CompiledPatterns.XREF_UNFIXED_REGEX
-        )  # Special unfixed version for fixing
-        self.context_id_regex = CompiledPatterns.ID_WITH_CONTEXT_REGEX
+    # Shared regex patterns, compiled once at import and bound at class level
+    id_regex = CompiledPatterns.ID_REGEX
+    include_regex = CompiledPatterns.INCLUDE_REGEX
+    id_or_include_regex = CompiledPatterns.ID_OR_INCLUDE_REGEX
+    xref_regex = CompiledPatterns.XREF_UNFIXED_REGEX  # Special unfixed version for fixing
+    context_id_regex = CompiledPatterns.ID_WITH_CONTEXT_REGEX
+
+    def __init__(
+        self,
+        validation_only: bool = False,
+        migration_mode: bool = False,
+        output: Optional[TextIO] = None,
+    ):
+        # Stream for console messages; None means sys.stdout at print time
+        self.output = output
 
         # The id_map dictionary maps the ID as the key and the file as the value
         self.id_map: Dict[str, str] = {}
@@ -513,18 +520,21 @@ class CrossReferenceProcessor:
 
                 # First pass: collect all IDs and potential context mappings
                 for line_num, line in enumerate(lines, 1):
-                    # Look for ID definitions
-                    id_match = self.id_regex.search(line.strip())
-                    include_match = self.include_regex.search(line.strip())
+                    # Look for an ID definition or include directive in one scan
+                    stripped = line.strip()
+                    match = self.id_or_include_regex.search(stripped)
+                    if not match:
+                        continue
+
+                    id_value, include_path = match.groups()
 
-                    if id_match:
-                        id_value = id_match.group(1)
+                    if id_value:
                         self.id_map[id_value] = file
                         logger.debug(f"Found ID '{id_value}' in file {file}")
 
                         # Collect potential context mappings for second pass
                         if self.migration_mode:
-                            context_match = self.context_id_regex.search(line.strip())
+                            context_match = self.context_id_regex.search(stripped)
                             if context_match:
                                 full_id = (
                                     context_match.group(1)
@@ -534,8 +544,7 @@ class CrossReferenceProcessor:
                                 base_id = context_match.group(1)
                                 temp_context_ids[full_id] = base_id
 
-                    elif include_match:
-                        include_path = include_match.group()
+                    else:
                         combined_path = os.path.join(path, include_path)
                         file_path = os.path.normpath(combined_path)
 
@@ -559,7 +568,7 @@ class CrossReferenceProcessor:
 
         except Exception as e:
             error_msg = f"Error reading {file}: {e}"
-            print(Highlighter(error_msg).warn())
+            print(Highlighter(error_msg).warn(), file=self.output)
             logger.error(error_msg)
 
     def prefer_context_free_ids(self, target_id: str, target_file: str) -> str:
@@ -663,7 +672,7 @@ class CrossReferenceProcessor:
         # Check if ID exists in our map
         if preferred_id not in self.id_map:
             warning = f"Warning: ID '{preferred_id}' not found in id_map (in {filepath}:{line_num})"
-            print(Highlighter(warning).warn())
+            print(Highlighter(warning).warn(), file=self.output)
             logger.warning(warning)
             self.warnings.append(warning)
 
@@ -697,11 +706,13 @@ class CrossReferenceProcessor:
             print(
                 Highlighter(
                     f"Migration-aware fix: {original_xref} -> {updated_xref} (context-free ID preferred)"
-                ).highlight()
+                ).highlight(),
+                file=self.output,
             )
         else:
             print(
-                Highlighter(f"Fix found! {original_xref} -> {updated_xref}").success()
+                Highlighter(f"Fix found! {original_xref} -> {updated_xref}").success(),
+                file=self.output,
             )
 
         logger.info(f"Updated xref: {original_xref} -> {updated_xref}")
@@ -756,7 +767,7 @@ class CrossReferenceProcessor:
 
         except Exception as e:
             error_msg = f"Error processing {filepath}: {e}"
-            print(Highlighter(error_msg).warn())
+            print(Highlighter(error_msg).warn(), file=self.output)
             logger.error(error_msg)
             self.warnings.append(error_msg)
 
@@ -804,17 +815,18 @@ def find_master_files(root_dir: str) -> List[str]:
     Returns:
         List of paths to master.adoc files found
     """
-    master_files = []
-    for root, dirs, files in os.walk(root_dir):
-        for file in files:
-            if file == "master.adoc":
-                full_path = os.path.join(root, file)
-                master_files.append(full_path)
-    return master_files
+    return [
+        os.path.join(root, "master.adoc")
+        for root, _dirs, files in os.walk(root_dir)
+        if "master.adoc" in files
+    ]
 
 
 def process_master_file(
-    filepath: str, validation_only: bool = False, migration_mode: bool = False
+    filepath: str,
+    validation_only: bool = False,
+    migration_mode: bool = False,
+    output: Optional[TextIO] = None,
 ) -> ValidationReport:
     """
     Process a single master.adoc file and fix cross-references.
@@ -823,18 +835,19 @@ def process_master_file(
         filepath: Path to the master.adoc file to process
         validation_only: If True, only validate without fixing
         migration_mode: If True, use migration-aware processing
+        output: Stream for console messages (defaults to sys.stdout)
 
     Returns:
         ValidationReport object
     """
-    processor = CrossReferenceProcessor(validation_only, migration_mode)
+    processor = CrossReferenceProcessor(validation_only, migration_mode, output)
 
     # Build the ID map from the master file
     processor.build_id_map(filepath)
 
     if not processor.id_map:
         warning = f"No IDs found in {filepath} or its includes"
-        print(Highlighter(warning).warn())
+        print(Highlighter(warning).warn(), file=output)
         logger.warning(warning)
         processor.warnings.append(warning)
         return processor.generate_validation_report()
@@ -843,9 +856,9 @@ def process_master_file(
     processor.process_files()
 
     if validation_only:
-        print(Highlighter("Cross-reference validation complete!").bold())
+        print(Highlighter("Cross-reference validation complete!").bold(), file=output)
     else:
-        print(Highlighter("Cross-reference processing complete!").bold())
+        print(Highlighter("Cross-reference processing complete!").bold(), file=output)
 
     logger.info("Cross-reference processing complete")
     return processor.generate_validation_report()
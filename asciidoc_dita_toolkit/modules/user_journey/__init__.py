@@ -141,7 +141,8 @@ class WorkflowState:
     # Class-level storage configuration for testing
     _default_storage_dir: Optional[Path] = None
 
-    def __init__(self, name: str, directory: str, modules: List[str]):
+    def __init__(self, name: str, directory: str, modules: List[str],
+                 storage_dir: Optional[Path] = None):
         """
         Initialize workflow state.
 
@@ -149,8 +150,10 @@ class WorkflowState:
             name: Unique workflow identifier
             directory: Target directory containing .adoc files
             modules: List of module names to execute in order
+            storage_dir: Optional storage directory overriding the class default
         """
         self.name = name
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
         self.directory = Path(directory).resolve()
         self.created = datetime.now().isoformat()
         self.last_activity = self.created
@@ -231,7 +234,9 @@ class WorkflowState:
 
     def get_storage_path(self) -> Path:
         """Get storage path with proper directory creation."""
-        if self._default_storage_dir is not None:
+        if self.storage_dir is not None:
+            storage_dir = self.storage_dir
+        elif self._default_storage_dir is not None:
             storage_dir = self._default_storage_dir
         else:
             storage_dir = Path.home() / ".adt" / "workflows"
@@ -315,7 +320,7 @@ class WorkflowState:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'WorkflowState':
+    def from_dict(cls, data: Dict[str, Any], storage_dir: Optional[Path] = None) -> 'WorkflowState':
         """Create WorkflowState from dictionary (loaded from JSON)."""
         # Extract module names from the data
         module_names = list(data.get("modules", {}).keys())
@@ -324,7 +329,8 @@ class WorkflowState:
         workflow = cls(
             name=data["name"],
             directory=data["directory"],
-            modules=module_names
+            modules=module_names,
+            storage_dir=storage_dir
         )
 
         # Restore state
@@ -406,7 +412,7 @@ class WorkflowState:
             data = cls._migrate_state_format(data)
             cls._validate_state_data(data)
 
-            return cls.from_dict(data)
+            return cls.from_dict(data, storage_dir)
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             # Try backup recovery
@@ -415,7 +421,7 @@ class WorkflowState:
                 try:
                     with open(backup_path) as f:
                         data = json.load(f)
-                    return cls.from_dict(data)
+                    return cls.from_dict(data, storage_dir)
                 except Exception:
                     pass
 
@@ -451,12 +457,15 @@ class WorkflowManager:
     # Storage configuration for testing
     _storage_dir: Optional[Path] = None
 
-    def __init__(self, module_sequencer: Optional[ModuleSequencer] = None):
+    def __init__(self, module_sequencer: Optional[ModuleSequencer] = None,
+                 storage_dir: Optional[Path] = None):
         """
         Initialize WorkflowManager.
 
         Args:
             module_sequencer: Optional pre-configured ModuleSequencer instance
+            storage_dir: Optional storage directory for this manager only;
+                unlike set_storage_directory(), it does not touch class state
         """
         if module_sequencer is None:
             self.sequencer = ModuleSequencer()
@@ -474,8 +483,10 @@ class WorkflowManager:
         else:
             self.sequencer = module_sequencer
 
-        # If we have a custom storage directory, apply it to WorkflowState as well
-        if self._storage_dir is not None:
+        if storage_dir is not None:
+            self._storage_dir = Path(storage_dir)
+        # If we have a class-wide storage directory, apply it to WorkflowState as well
+        elif self._storage_dir is not None:
             WorkflowState._default_storage_dir = self._storage_dir
 
     @classmethod
@@ -515,7 +526,8 @@ class WorkflowManager:
         planned_modules = self.get_planned_modules()
 
         # Create workflow state
-        workflow = WorkflowState(name, str(directory_path), planned_modules)
+        workflow = WorkflowState(name, str(directory_path), planned_modules,
+                                 storage_dir=self._storage_dir)
         workflow.save_to_disk()
 
         return workflow
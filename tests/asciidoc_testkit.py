@@ -6,6 +6,7 @@ Provides functions for fixture discovery and test running, to be imported by all
 
 import difflib
 import os
+from pathlib import Path
 
 
 def get_fixture_pairs(
@@ -64,13 +65,16 @@ def run_linewise_test(input_path, expected_path, transform_func):
     """
     with open(input_path, encoding="utf-8") as f:
         input_lines = f.readlines()
-    with open(expected_path, encoding="utf-8") as f:
-        expected_lines = f.readlines()
-    output_lines = [transform_func(line) for line in input_lines]
-    if output_lines != expected_lines:
+    expected_text = Path(expected_path).read_text(encoding="utf-8")
+    output_text = "".join(transform_func(line) for line in input_lines)
+    if output_text != expected_text:
+        # Only split into lines when a diff is actually needed
         print(f"Test failed for {os.path.basename(input_path)}:")
         diff = difflib.unified_diff(
-            expected_lines, output_lines, fromfile="expected", tofile="actual"
+            expected_text.splitlines(keepends=True),
+            output_text.splitlines(keepends=True),
+            fromfile="expected",
+            tofile="actual",
         )
         print("".join(diff))
         return False
@@ -6,7 +6,7 @@ tests/fixtures/EntityReference/.
 
 For each .adoc file, it expects a corresponding .expected file in the same directory.
 
-To run: python3 tests/test_EntityReference.py
+To run: python3 -m pytest tests/test_EntityReference.py
 
 Recommended: Integrate this script into CI to catch regressions.
 """
@@ -34,6 +34,9 @@ FIXTURE_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "fixtures", "EntityReference")
 )
 
+# Scan the fixture directory once at import rather than per test run.
+_FIXTURE_PAIRS = tuple(get_same_dir_fixture_pairs(FIXTURE_DIR))
+
 
 class TestEntityReference(unittest.TestCase):
     """Test cases for the EntityReference plugin."""
@@ -100,7 +103,7 @@ class TestEntityReference(unittest.TestCase):
         """Run tests based on fixture files if they exist."""
         if os.path.exists(FIXTURE_DIR):
             fixture_count = 0
-            for input_path, expected_path in get_same_dir_fixture_pairs(FIXTURE_DIR):
+            for input_path, expected_path in _FIXTURE_PAIRS:
                 fixture_count += 1
                 with self.subTest(fixture=os.path.basename(input_path)):
                     # Use file-based test for fixtures that contain comments
@@ -122,33 +125,5 @@ class TestEntityReference(unittest.TestCase):
             self.skipTest(f"Fixture directory not found: {FIXTURE_DIR}")
 
 
-def main():
-    """Run tests with optional fixture-based testing."""
-    # First run unit tests
-    unittest.main(verbosity=2, exit=False)
-
-    # Then run fixture-based tests if available
-    if os.path.exists(FIXTURE_DIR):
-        print("\nRunning fixture-based tests...")
-        any_failed = False
-        test_count = 0
-
-        for input_path, expected_path in get_same_dir_fixture_pairs(FIXTURE_DIR):
-            test_count += 1
-            if not run_linewise_test(input_path, expected_path, replace_entities):
-                any_failed = True
-
-        if test_count == 0:
-            print("No fixture files found.")
-        elif any_failed:
-            print(f"\nSome fixture tests failed out of {test_count} tests.")
-            sys.exit(1)
-        else:
-            print(f"All {test_count} EntityReference fixture tests passed.")
-    else:
-        print(f"Fixture directory not found: {FIXTURE_DIR}")
-        print("Skipping fixture-based tests.")
-
-
 if __name__ == "__main__":
-    main()
+    unittest.main()
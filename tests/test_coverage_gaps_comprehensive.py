@@ -11,125 +11,218 @@ This test file addresses the specific coverage gaps identified:
 6. Performance and edge cases
 """
 import json
-import os
 import pytest
-import shutil
-import tempfile
+import sys
 import threading
-import time
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 from types import SimpleNamespace
 
 # Import UserJourney components
+from asciidoc_dita_toolkit.adt_core.module_sequencer import ModuleState
 from asciidoc_dita_toolkit.modules.user_journey import (
     WorkflowState, 
     WorkflowManager,
     UserJourneyProcessor,
     UserJourneyModule,
     WorkflowStateError,
-    WorkflowExecutionError,
-    InvalidDirectoryError
+    WorkflowExecutionError
 )
 
 
+class FakeModule:
+    """Minimal module whose initialization or execution can be made to fail."""
+    
+    def __init__(self, *, execute_error=None, init_status="success"):
+        self._initialized = False
+        self._execute_error = execute_error
+        self._init_result = {
+            "status": init_status,
+            "message": "Init failed" if init_status == "error" else "",
+        }
+    
+    def initialize(self, config=None):
+        return self._init_result
+    
+    def execute(self, file_path, **kwargs):
+        if self._execute_error is not None:
+            raise self._execute_error
+        return {"status": "success"}
+
+
+class FakeSequencer:
+    """Sequencer stand-in that plans a single enabled DirectoryConfig module."""
+    
+    def __init__(self, module):
+        self.available_modules = {"DirectoryConfig": module}
+        self._resolution = SimpleNamespace(name="DirectoryConfig", state=ModuleState.ENABLED)
+    
+    def sequence_modules(self, *args, **kwargs):
+        return [self._resolution], []
+
+
+# Lightweight stand-in for ExecutionResult in mark_module_completed() calls
+_DUMMY_RESULT = SimpleNamespace(files_processed=1, files_modified=0, execution_time=0.1)
+
+# Contents written over a workflow state file to corrupt it
+_CORRUPT_JSON_BYTES = b"invalid json content {"
+
+# Number of .adoc files in the shared large project fixture
+LARGE_PROJECT_FILE_COUNT = 32
+
+
+@pytest.fixture(scope="session")
+def large_project(tmp_path_factory):
+    """Create a project with many .adoc files once per test session."""
+    project = tmp_path_factory.mktemp("large_project")
+    for i in range(LARGE_PROJECT_FILE_COUNT):
+        (project / f"doc_{i:03d}.adoc").write_text(f"= Document {i}\nContent {i}")
+    return project
+
+
+@pytest.fixture(scope="module")
+def initialized_module():
+    """Initialize UserJourneyModule once for the CLI tests that only read from it."""
+    module = UserJourneyModule()
+    module.initialize()
+    return module
+
+
+@pytest.fixture
+def storage_dir(tmp_path):
+    """Per-test workflow storage directory, cleaned up by pytest."""
+    storage = tmp_path / "workflows"
+    storage.mkdir()
+    return storage
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    """Per-test project directory with two .adoc files."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "doc1.adoc").write_text("= Doc 1\nContent")
+    (project / "doc2.adoc").write_text("= Doc 2\nContent")
+    return project
+
+
+@pytest.fixture
+def unicode_project(tmp_path):
+    """Project directory and .adoc file with Cyrillic names."""
+    if sys.getfilesystemencoding().lower() not in ('utf-8', 'utf8'):
+        pytest.skip("Unicode paths require a UTF-8 filesystem encoding")
+    project = tmp_path / "проект_тест"
+    project.mkdir()
+    (project / "документ_тёст.adoc").write_bytes("= Тестовый документ\nСодержание".encode("utf-8"))
+    return project
+
+
+@pytest.fixture(scope="module")
+def module_sequencer(tmp_path_factory):
+    """Discover ADT modules once and share the sequencer across processors."""
+    return WorkflowManager(storage_dir=tmp_path_factory.mktemp("workflows")).sequencer
+
+
+@pytest.fixture
+def processor(module_sequencer, storage_dir):
+    """UserJourneyProcessor whose workflow manager uses this test's storage."""
+    return UserJourneyProcessor(WorkflowManager(module_sequencer, storage_dir=storage_dir))
+
+
+@pytest.fixture
+def corrupted_workflow(request, storage_dir, project_dir):
+    """Persist a workflow, then damage its storage as named by request.param."""
+    corruption = request.param
+    workflow = WorkflowState("corrupt_test", str(project_dir), ["DirectoryConfig"],
+                             storage_dir=storage_dir)
+    state_path = workflow.get_storage_path()
+    
+    if corruption == "json_with_backup":
+        # Corrupt the main file but leave a valid backup next to it
+        workflow.save_to_disk()
+        state_path.write_bytes(_CORRUPT_JSON_BYTES)
+        backup_data = {
+            "name": "corrupt_test",
+            "directory": str(project_dir),
+            "modules": {"DirectoryConfig": {"status": "pending"}},
+            "files_discovered": [],
+            "metadata": {"version": "1.0"}
+        }
+        state_path.with_suffix('.backup').write_text(json.dumps(backup_data))
+    elif corruption == "json_no_backup":
+        state_path.write_bytes(_CORRUPT_JSON_BYTES)
+    elif corruption == "tmp_file_leftover":
+        # Simulate an interrupted atomic write
+        workflow.save_to_disk()
+        state_path.with_suffix('.tmp').write_text("interrupted write")
+    else:
+        raise ValueError(f"Unknown corruption scenario: {corruption}")
+    
+    return workflow
+
+
+@pytest.fixture
+def status_target(request, storage_dir, project_dir):
+    """Set up workflows for a status scenario and return the name to display."""
+    if request.param == "no_workflows":
+        # Status with no name lists workflows; there are none
+        return None
+    if request.param != "mixed_states":
+        raise ValueError(f"Unknown status scenario: {request.param}")
+    
+    # Create workflow with various states
+    workflow = WorkflowState("format_test", str(project_dir),
+                             ["DirectoryConfig", "CrossReference", "ExampleBlock"],
+                             storage_dir=storage_dir)
+    
+    # Set up mixed states
+    workflow.mark_module_completed("DirectoryConfig",
+        SimpleNamespace(files_processed=100, files_modified=50, execution_time=123.456))
+    workflow.mark_module_failed("CrossReference", "Very long error message that might cause formatting issues when displayed in the terminal")
+    # Leave ExampleBlock as pending
+    
+    workflow.save_to_disk()
+    return "format_test"
+
+
 class TestComprehensiveCoverageGaps:
     """Test comprehensive coverage gaps in UserJourney implementation."""
     
-    def setup_method(self, method):
-        """Set up test environment with temporary directories."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.temp_storage = self.temp_dir / "workflows"
-        self.temp_storage.mkdir()
-        self.test_project = self.temp_dir / "project"
-        self.test_project.mkdir()
-        
-        # Create test .adoc files
-        (self.test_project / "doc1.adoc").write_text("= Doc 1\nContent")
-        (self.test_project / "doc2.adoc").write_text("= Doc 2\nContent")
-        
-        # Set storage for testing
-        WorkflowState._default_storage_dir = self.temp_storage
-        WorkflowManager.set_storage_directory(self.temp_storage)
-    
-    def teardown_method(self, method):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        WorkflowState._default_storage_dir = None
-        
     # ================================================================
     # 1. MODULE EXECUTION FAILURE SCENARIOS
     # ================================================================
     
-    def test_module_crash_during_execution(self):
+    def test_module_crash_during_execution(self, storage_dir, project_dir):
         """Test handling when a module crashes during execution."""
-        # Import the ModuleState enum for proper mocking
-        from asciidoc_dita_toolkit.adt_core.module_sequencer import ModuleState
-        
-        # Create workflow with mock sequencer that has proper resolution structure
-        mock_sequencer = Mock()
-        mock_resolution = Mock()
-        mock_resolution.name = "DirectoryConfig"
-        mock_resolution.state = ModuleState.ENABLED
-        
-        mock_sequencer.sequence_modules.return_value = ([mock_resolution], [])
-        
-        # Mock available modules with a crashing module
-        crashing_module = Mock()
-        crashing_module.execute.side_effect = RuntimeError("Module crashed!")
-        crashing_module.initialize.return_value = {"status": "success"}
-        crashing_module._initialized = False
-        
-        mock_sequencer.available_modules = {
-            "DirectoryConfig": crashing_module
-        }
+        sequencer = FakeSequencer(FakeModule(execute_error=RuntimeError("Module crashed!")))
         
-        manager = WorkflowManager(mock_sequencer)
-        workflow = manager.start_workflow("crash_test", str(self.test_project))
+        manager = WorkflowManager(sequencer, storage_dir=storage_dir)
+        workflow = manager.start_workflow("crash_test", str(project_dir))
         
         # Execution should handle the crash gracefully
-        with pytest.raises(WorkflowExecutionError) as exc_info:
+        with pytest.raises(WorkflowExecutionError, match="Module DirectoryConfig failed"):
             manager.execute_next_module(workflow)
         
-        assert "Module DirectoryConfig failed" in str(exc_info.value)
-        
         # Verify workflow state is updated correctly
         updated_workflow = manager.resume_workflow("crash_test")
         assert updated_workflow.modules["DirectoryConfig"].status == "failed"
         assert "Module crashed!" in updated_workflow.modules["DirectoryConfig"].error_message
         assert updated_workflow.modules["DirectoryConfig"].retry_count == 1
 
-    def test_module_initialization_failure(self):
+    def test_module_initialization_failure(self, storage_dir, project_dir):
         """Test handling when module initialization fails."""
-        from asciidoc_dita_toolkit.adt_core.module_sequencer import ModuleState
-        
-        mock_sequencer = Mock()
-        mock_resolution = Mock()
-        mock_resolution.name = "DirectoryConfig"
-        mock_resolution.state = ModuleState.ENABLED
+        sequencer = FakeSequencer(FakeModule(init_status="error"))
         
-        mock_sequencer.sequence_modules.return_value = ([mock_resolution], [])
-        
-        # Mock module that fails initialization
-        failing_module = Mock()
-        failing_module.initialize.return_value = {"status": "error", "message": "Init failed"}
-        failing_module._initialized = False
-        
-        mock_sequencer.available_modules = {
-            "DirectoryConfig": failing_module
-        }
-        
-        manager = WorkflowManager(mock_sequencer)
-        workflow = manager.start_workflow("init_fail_test", str(self.test_project))
+        manager = WorkflowManager(sequencer, storage_dir=storage_dir)
+        workflow = manager.start_workflow("init_fail_test", str(project_dir))
         
         # Should handle init failure
         with pytest.raises(WorkflowExecutionError):
             manager.execute_next_module(workflow)
 
-    def test_directory_config_import_failure_handling(self):
+    def test_directory_config_import_failure_handling(self, storage_dir, project_dir):
         """Test graceful handling when DirectoryConfig cannot be imported."""
         # This tests the fallback behavior in _refresh_file_discovery
-        workflow = WorkflowState("import_test", str(self.test_project), ["DirectoryConfig"])
+        workflow = WorkflowState("import_test", str(project_dir), ["DirectoryConfig"], storage_dir=storage_dir)
         
         # The fallback discovery should work regardless of DirectoryConfig availability
         workflow._refresh_file_discovery()
@@ -145,99 +238,72 @@ class TestComprehensiveCoverageGaps:
     # 2. STORAGE CORRUPTION AND RECOVERY SCENARIOS
     # ================================================================
     
-    def test_corrupted_json_recovery(self):
-        """Test recovery from corrupted JSON workflow state."""
-        # Create a workflow first
-        workflow = WorkflowState("corrupt_test", str(self.test_project), ["DirectoryConfig"])
-        workflow.save_to_disk()
-        
-        # Corrupt the main file
-        state_path = workflow.get_storage_path()
-        with open(state_path, 'w') as f:
-            f.write("invalid json content {")
-        
-        # Create a valid backup
-        backup_path = state_path.with_suffix('.backup')
-        backup_data = {
-            "name": "corrupt_test",
-            "directory": str(self.test_project),
-            "modules": {"DirectoryConfig": {"status": "pending"}},
-            "files_discovered": [],
-            "metadata": {"version": "1.0"}
-        }
-        with open(backup_path, 'w') as f:
-            json.dump(backup_data, f)
-        
-        # Loading should recover from backup
-        recovered = WorkflowState.load_from_disk("corrupt_test", self.temp_storage)
+    @pytest.mark.parametrize("corrupted_workflow", [
+        pytest.param("json_with_backup", id="main-corrupt-backup-ok"),
+    ], indirect=True)
+    def test_storage_corruption_recovers_from_backup(self, corrupted_workflow, storage_dir):
+        """Test that loading a corrupted workflow falls back to its backup."""
+        recovered = WorkflowState.load_from_disk("corrupt_test", storage_dir)
         assert recovered.name == "corrupt_test"
         assert "DirectoryConfig" in recovered.modules
 
-    def test_missing_backup_corruption_handling(self):
-        """Test handling when both main file and backup are corrupted."""
-        # Create and immediately corrupt workflow file
-        workflow = WorkflowState("no_backup_test", str(self.test_project), ["DirectoryConfig"])
-        state_path = workflow.get_storage_path()
-        
-        with open(state_path, 'w') as f:
-            f.write("invalid json")
-        
-        # No backup file exists
-        with pytest.raises(WorkflowStateError) as exc_info:
-            WorkflowState.load_from_disk("no_backup_test", self.temp_storage)
-        
-        assert "Corrupted workflow state" in str(exc_info.value)
+    @pytest.mark.parametrize("corrupted_workflow", [
+        pytest.param("json_no_backup", id="main-corrupt-no-backup"),
+    ], indirect=True)
+    def test_storage_corruption_without_backup_raises(self, corrupted_workflow, storage_dir):
+        """Test that a corrupted workflow with no backup reports an error."""
+        with pytest.raises(WorkflowStateError, match="Corrupted workflow state"):
+            WorkflowState.load_from_disk("corrupt_test", storage_dir)
 
-    def test_atomic_write_interruption_recovery(self):
-        """Test recovery when atomic write is interrupted."""
-        workflow = WorkflowState("atomic_test", str(self.test_project), ["DirectoryConfig"])
-        
-        # Create initial state
-        workflow.save_to_disk()
-        
-        # Simulate interrupted write by creating temp file
-        temp_path = workflow.get_storage_path().with_suffix('.tmp')
-        with open(temp_path, 'w') as f:
-            f.write("interrupted write")
+    @pytest.mark.parametrize("corrupted_workflow", [
+        pytest.param("tmp_file_leftover", id="atomic-interrupt"),
+    ], indirect=True)
+    def test_storage_corruption_cleans_up_temp_file(self, corrupted_workflow, storage_dir):
+        """Test that saving after an interrupted write removes the leftover temp file."""
+        temp_path = corrupted_workflow.get_storage_path().with_suffix('.tmp')
         
         # Next save should handle existing temp file
-        workflow.mark_module_completed("DirectoryConfig", Mock(files_processed=5, files_modified=2, execution_time=1.5))
-        workflow.save_to_disk()  # Should succeed despite temp file
+        corrupted_workflow.mark_module_completed(
+            "DirectoryConfig",
+            SimpleNamespace(files_processed=5, files_modified=2, execution_time=1.5))
+        corrupted_workflow.save_to_disk()  # Should succeed despite temp file
         
         # Verify temp file was cleaned up
         assert not temp_path.exists()
         
         # Verify state was saved correctly
-        reloaded = WorkflowState.load_from_disk("atomic_test", self.temp_storage)
+        reloaded = WorkflowState.load_from_disk("corrupt_test", storage_dir)
         assert reloaded.modules["DirectoryConfig"].status == "completed"
 
     # ================================================================
     # 3. CONCURRENT ACCESS SCENARIOS
     # ================================================================
     
-    def test_concurrent_workflow_access(self):
+    @pytest.mark.slow
+    def test_concurrent_workflow_access(self, storage_dir, project_dir):
         """Test handling concurrent access to same workflow."""
-        workflow = WorkflowState("concurrent_test", str(self.test_project), ["DirectoryConfig", "CrossReference"])
+        workflow = WorkflowState("concurrent_test", str(project_dir),
+                                 ["DirectoryConfig", "CrossReference"], storage_dir=storage_dir)
         workflow.save_to_disk()
         
         errors = []
         results = []
+        # Both threads load the workflow before either of them writes it back
+        barrier = threading.Barrier(2)
         
         def modify_workflow(thread_id):
             """Function to modify workflow from different threads."""
             try:
-                local_workflow = WorkflowState.load_from_disk("concurrent_test", self.temp_storage)
+                local_workflow = WorkflowState.load_from_disk("concurrent_test", storage_dir)
                 
-                # Simulate some processing time
-                time.sleep(0.1)
+                barrier.wait(timeout=2.0)
                 
                 # Each thread tries to mark a different module as completed
                 if thread_id == 0:
-                    local_workflow.mark_module_completed("DirectoryConfig", 
-                        Mock(files_processed=1, files_modified=0, execution_time=0.5))
+                    local_workflow.mark_module_completed("DirectoryConfig", _DUMMY_RESULT)
                 else:
                     local_workflow.mark_module_completed("CrossReference", 
-                        Mock(files_processed=2, files_modified=1, execution_time=1.0))
+                        SimpleNamespace(files_processed=2, files_modified=1, execution_time=1.0))
                 
                 local_workflow.save_to_disk()
                 results.append(f"Thread {thread_id} succeeded")
@@ -261,57 +327,38 @@ class TestComprehensiveCoverageGaps:
         assert len(results) >= 1 or len(errors) >= 1  # Something should happen
         
         # Final state should be consistent
-        final_workflow = WorkflowState.load_from_disk("concurrent_test", self.temp_storage)
+        final_workflow = WorkflowState.load_from_disk("concurrent_test", storage_dir)
         assert final_workflow.name == "concurrent_test"
 
     # ================================================================
     # 4. INTERACTIVE USER INPUT SCENARIOS
     # ================================================================
     
-    def test_user_confirmation_yes_response(self):
-        """Test user confirmation with 'yes' response."""
-        processor = UserJourneyProcessor()
-        
+    @pytest.mark.parametrize("response,expected_exists", [
+        pytest.param("y", False, id="yes"),
+        pytest.param("n", True, id="no"),
+    ])
+    def test_cleanup_confirmation(self, response, expected_exists, processor, storage_dir, project_dir):
+        """Test user confirmation of single-workflow cleanup."""
         # Mock workflow for cleanup test
-        workflow = WorkflowState("confirm_test", str(self.test_project), ["DirectoryConfig"])
+        workflow = WorkflowState("confirm_test", str(project_dir), ["DirectoryConfig"], storage_dir=storage_dir)
         workflow.save_to_disk()
         
-        # Mock input to return 'y'
-        with patch('builtins.input', return_value='y'):
-            args = SimpleNamespace(name="confirm_test")
+        with patch('builtins.input', return_value=response):
             result = processor._cleanup_specific_workflow("confirm_test")
         
-        assert result == 0  # Success
-        
-        # Workflow should be deleted
-        assert not processor.workflow_manager.workflow_exists("confirm_test")
-
-    def test_user_confirmation_no_response(self):
-        """Test user confirmation with 'no' response."""
-        processor = UserJourneyProcessor()
-        
-        # Mock workflow for cleanup test
-        workflow = WorkflowState("no_confirm_test", str(self.test_project), ["DirectoryConfig"])
-        workflow.save_to_disk()
-        
-        # Mock input to return 'n'
-        with patch('builtins.input', return_value='n'):
-            result = processor._cleanup_specific_workflow("no_confirm_test")
+        assert result == 0  # Success (deleted or cancelled)
         
-        assert result == 0  # Success (cancelled)
-        
-        # Workflow should still exist
-        assert processor.workflow_manager.workflow_exists("no_confirm_test")
+        # Workflow is deleted only when the user confirms
+        assert processor.workflow_manager.workflow_exists("confirm_test") == expected_exists
 
-    def test_bulk_cleanup_with_confirmation(self):
+    def test_bulk_cleanup_with_confirmation(self, processor, storage_dir, project_dir):
         """Test bulk cleanup with user confirmation."""
-        processor = UserJourneyProcessor()
-        
         # Create multiple completed workflows
         for i in range(3):
-            workflow = WorkflowState(f"bulk_test_{i}", str(self.test_project), ["DirectoryConfig"])
-            workflow.mark_module_completed("DirectoryConfig", 
-                Mock(files_processed=1, files_modified=0, execution_time=0.1))
+            workflow = WorkflowState(f"bulk_test_{i}", str(project_dir), ["DirectoryConfig"],
+                                     storage_dir=storage_dir)
+            workflow.mark_module_completed("DirectoryConfig", _DUMMY_RESULT)
             workflow.save_to_disk()
         
         # Mock input to confirm deletion
@@ -329,53 +376,27 @@ class TestComprehensiveCoverageGaps:
     # 5. PERFORMANCE AND EDGE CASES
     # ================================================================
     
-    def test_large_file_count_performance(self):
-        """Test performance with large number of files."""
-        # Create directory with many files
-        large_project = self.temp_dir / "large_project"
-        large_project.mkdir()
-        
-        # Create 100 .adoc files
-        for i in range(100):
-            (large_project / f"doc_{i:03d}.adoc").write_text(f"= Document {i}\nContent {i}")
+    @pytest.mark.slow
+    @pytest.mark.benchmark
+    def test_large_file_count_performance(self, large_project, storage_dir, benchmark):
+        """Benchmark save/load round trip of a workflow with many files."""
         
-        # Test workflow creation performance
-        start_time = time.time()
-        workflow = WorkflowState("large_test", str(large_project), ["DirectoryConfig"])
-        creation_time = time.time() - start_time
-        
-        # Should complete quickly (under 1 second for 100 files)
-        assert creation_time < 1.0
+        workflow = WorkflowState("large_test", str(large_project), ["DirectoryConfig"], storage_dir=storage_dir)
         
         # Should discover all files
-        assert len(workflow.files_discovered) >= 100
-        
-        # Test save/load performance
-        start_time = time.time()
-        workflow.save_to_disk()
-        save_time = time.time() - start_time
+        assert len(workflow.files_discovered) >= LARGE_PROJECT_FILE_COUNT
         
-        start_time = time.time()
-        reloaded = WorkflowState.load_from_disk("large_test", self.temp_storage)
-        load_time = time.time() - start_time
+        def round_trip():
+            workflow.save_to_disk()
+            return WorkflowState.load_from_disk("large_test", storage_dir)
         
-        # Performance targets
-        assert save_time < 0.5  # Save under 0.5 seconds
-        assert load_time < 0.5  # Load under 0.5 seconds
-        assert len(reloaded.files_discovered) >= 100
+        reloaded = benchmark(round_trip)
+        assert len(reloaded.files_discovered) >= LARGE_PROJECT_FILE_COUNT
 
-    def test_unicode_path_handling(self):
+    def test_unicode_path_handling(self, unicode_project, storage_dir):
         """Test handling of Unicode characters in paths and names."""
-        # Create directory with Unicode name
-        unicode_project = self.temp_dir / "проект_тест"  # Cyrillic characters
-        unicode_project.mkdir()
-        
-        # Create file with Unicode name
-        unicode_file = unicode_project / "документ_тёст.adoc"
-        unicode_file.write_text("= Тестовый документ\nСодержание")
-        
         # Test workflow with Unicode paths
-        workflow = WorkflowState("unicode_тест", str(unicode_project), ["DirectoryConfig"])
+        workflow = WorkflowState("unicode_тест", str(unicode_project), ["DirectoryConfig"], storage_dir=storage_dir)
         workflow.save_to_disk()
         
         # Should handle Unicode correctly
@@ -383,12 +404,12 @@ class TestComprehensiveCoverageGaps:
         assert any("документ_тёст.adoc" in path for path in workflow.files_discovered)
         
         # Should load correctly
-        reloaded = WorkflowState.load_from_disk("unicode_тест", self.temp_storage)
+        reloaded = WorkflowState.load_from_disk("unicode_тест", storage_dir)
         assert reloaded.name == "unicode_тест"
 
-    def test_very_long_error_messages(self):
+    def test_very_long_error_messages(self, storage_dir, project_dir):
         """Test handling of very long error messages."""
-        workflow = WorkflowState("error_test", str(self.test_project), ["DirectoryConfig"])
+        workflow = WorkflowState("error_test", str(project_dir), ["DirectoryConfig"], storage_dir=storage_dir)
         
         # Create very long error message
         long_error = "Error: " + "x" * 10000  # 10KB error message
@@ -397,15 +418,17 @@ class TestComprehensiveCoverageGaps:
         workflow.save_to_disk()
         
         # Should handle long error without issues
-        reloaded = WorkflowState.load_from_disk("error_test", self.temp_storage)
+        reloaded = WorkflowState.load_from_disk("error_test", storage_dir)
         assert reloaded.modules["DirectoryConfig"].error_message == long_error
         assert reloaded.modules["DirectoryConfig"].status == "failed"
 
-    def test_workflow_with_many_modules(self):
+    @pytest.mark.slow
+    def test_workflow_with_many_modules(self, storage_dir, project_dir):
         """Test workflow with large number of modules."""
         # Create workflow with many modules
         many_modules = [f"Module_{i:02d}" for i in range(50)]
-        workflow = WorkflowState("many_modules_test", str(self.test_project), many_modules)
+        workflow = WorkflowState("many_modules_test", str(project_dir), many_modules,
+                                 storage_dir=storage_dir)
         
         # Should handle many modules efficiently
         assert len(workflow.modules) == 50
@@ -417,9 +440,8 @@ class TestComprehensiveCoverageGaps:
         assert progress.completion_percentage == 0.0
         
         # Complete half the modules
-        for i in range(25):
-            workflow.mark_module_completed(f"Module_{i:02d}", 
-                Mock(files_processed=1, files_modified=0, execution_time=0.1))
+        for name in many_modules[:25]:
+            workflow.mark_module_completed(name, _DUMMY_RESULT)
         
         progress = workflow.get_progress_summary()
         assert progress.completed_modules == 25
@@ -430,13 +452,10 @@ class TestComprehensiveCoverageGaps:
     # 6. CLI AND INTEGRATION EDGE CASES
     # ================================================================
     
-    def test_cli_parser_integration(self):
+    def test_cli_parser_integration(self, initialized_module):
         """Test CLI parser integration and command dispatch."""
-        module = UserJourneyModule()
-        module.initialize()
-        
         # Test parser creation
-        parser = module.get_cli_parser()
+        parser = initialized_module.get_cli_parser()
         assert parser is not None
         
         # Test parsing various commands
@@ -450,15 +469,12 @@ class TestComprehensiveCoverageGaps:
         assert cleanup_args.journey_command == 'cleanup'
         assert cleanup_args.completed == True
 
-    def test_invalid_command_dispatch(self):
+    def test_invalid_command_dispatch(self, initialized_module):
         """Test handling of invalid CLI commands."""
-        module = UserJourneyModule()
-        module.initialize()
-        
         # Create args with invalid command
         invalid_args = SimpleNamespace(journey_command='invalid_command')
         
-        result = module.process_cli_command(invalid_args)
+        result = initialized_module.process_cli_command(invalid_args)
         assert result == 1  # Error exit code
 
     def test_uninitialized_module_command_processing(self):
@@ -474,37 +490,14 @@ class TestComprehensiveCoverageGaps:
     # 7. EDGE CASES IN STATUS DISPLAY
     # ================================================================
     
-    def test_status_display_with_no_workflows(self):
-        """Test status display when no workflows exist."""
-        processor = UserJourneyProcessor()
+    @pytest.mark.parametrize("status_target", ["no_workflows", "mixed_states"], indirect=True)
+    def test_status_display(self, status_target, processor):
+        """Test status display with no workflows and with formatting edge cases."""
+        args = SimpleNamespace(name=status_target)
         
-        args = SimpleNamespace(name=None)
-        result = processor.process_status_command(args)
-        
-        assert result == 0  # Should succeed but show no workflows
-
-    def test_status_display_formatting_edge_cases(self):
-        """Test status display formatting with edge cases."""
-        processor = UserJourneyProcessor()
-        
-        # Create workflow with various states
-        workflow = WorkflowState("format_test", str(self.test_project), 
-                                ["DirectoryConfig", "CrossReference", "ExampleBlock"])
-        
-        # Set up mixed states
-        workflow.mark_module_completed("DirectoryConfig", 
-            Mock(files_processed=100, files_modified=50, execution_time=123.456))
-        workflow.mark_module_failed("CrossReference", "Very long error message that might cause formatting issues when displayed in the terminal")
-        # Leave ExampleBlock as pending
-        
-        workflow.save_to_disk()
-        
-        # Test detailed status display
-        args = SimpleNamespace(name="format_test")
         result = processor.process_status_command(args)
         
         assert result == 0  # Should succeed despite formatting challenges
 
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
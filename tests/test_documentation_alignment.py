@@ -8,7 +8,7 @@ the Plugin Development Guide accurately reflects the established patterns.
 
 import sys
 import inspect
-import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
@@ -20,6 +20,10 @@ if str(src_path) not in sys.path:
 if str(workspace_root) not in sys.path:
     sys.path.insert(0, str(workspace_root))
 
+# The same classes, methods and properties are inspected by several tests
+_cached_doc = lru_cache(maxsize=256)(inspect.getdoc)
+_cached_sig = lru_cache(maxsize=256)(inspect.signature)
+
 
 def test_adtmodule_interface_documentation():
     """Test that ADTModule interface has proper documentation."""
@@ -30,7 +34,7 @@ def test_adtmodule_interface_documentation():
         from asciidoc_dita_toolkit.adt_core.module_sequencer import ADTModule
 
         # Check class docstring
-        class_docstring = inspect.getdoc(ADTModule)
+        class_docstring = _cached_doc(ADTModule)
         if not class_docstring:
             print("  ❌ ADTModule class missing docstring")
             return False
@@ -53,7 +57,7 @@ def test_adtmodule_interface_documentation():
         for method_name in required_methods:
             method = getattr(ADTModule, method_name, None)
             if method:
-                docstring = inspect.getdoc(method)
+                docstring = _cached_doc(method)
                 if not docstring:
                     docstring_issues.append(f"Method {method_name} missing docstring")
                 else:
@@ -86,7 +90,7 @@ def test_entityreference_documentation():
         )
 
         # Check class docstring
-        class_docstring = inspect.getdoc(EntityReferenceModule)
+        class_docstring = _cached_doc(EntityReferenceModule)
         if not class_docstring:
             print("  ❌ EntityReferenceModule class missing docstring")
             return False
@@ -100,7 +104,7 @@ def test_entityreference_documentation():
         for method_name in methods_to_check:
             method = getattr(EntityReferenceModule, method_name, None)
             if method:
-                docstring = inspect.getdoc(method)
+                docstring = _cached_doc(method)
                 if not docstring:
                     docstring_quality.append(f"Method {method_name} missing docstring")
                 else:
@@ -147,19 +151,18 @@ def test_docstring_style_consistency():
             EntityReferenceModule,
         )
 
-        # Get all methods
-        methods = inspect.getmembers(
-            EntityReferenceModule, predicate=inspect.isfunction
-        )
+        # Public methods defined on the class itself
+        methods = [
+            (name, member)
+            for name, member in vars(EntityReferenceModule).items()
+            if inspect.isfunction(member) and not name.startswith('_')
+        ]
 
         style_issues = []
         google_style_count = 0
 
         for method_name, method in methods:
-            if method_name.startswith('_'):
-                continue  # Skip private methods
-
-            docstring = inspect.getdoc(method)
+            docstring = _cached_doc(method)
             if docstring:
                 # Check for Google-style docstring patterns
                 has_args_section = "Args:" in docstring
@@ -206,7 +209,7 @@ def test_type_hints_consistency():
         for method_name in methods_to_check:
             method = getattr(EntityReferenceModule, method_name, None)
             if method:
-                signature = inspect.signature(method)
+                signature = _cached_sig(method)
 
                 # Check parameter type hints
                 for param_name, param in signature.parameters.items():
@@ -264,7 +267,7 @@ def test_property_documentation():
         for prop_name in properties_to_check:
             prop = getattr(EntityReferenceModule, prop_name, None)
             if prop:
-                docstring = inspect.getdoc(prop)
+                docstring = _cached_doc(prop)
                 if not docstring:
                     property_issues.append(f"Property {prop_name} missing docstring")
                 else:
@@ -324,10 +327,12 @@ def test_plugin_development_guide_accuracy():
             "Type Hints",
         ]
 
-        missing_sections = []
-        for section in required_sections:
-            if section.lower() not in guide_content.lower():
-                missing_sections.append(section)
+        lower_guide = guide_content.lower()
+        missing_sections = [
+            section
+            for section in required_sections
+            if section.lower() not in lower_guide
+        ]
 
         if missing_sections:
             print(f"  ⚠️  Guide missing sections: {missing_sections}")
@@ -335,7 +340,7 @@ def test_plugin_development_guide_accuracy():
             print("  ✅ Guide contains all required sections")
 
         # Check for code examples
-        code_block_count = len(re.findall(r'```python', guide_content))
+        code_block_count = guide_content.count('```python')
         if code_block_count < 3:
             print(f"  ⚠️  Guide has only {code_block_count} Python code examples")
         else:
@@ -12,7 +12,7 @@ import os
 import tempfile
 import unittest.mock as mock
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # Add the project root to Python path
 sys.path.insert(0, '..')
@@ -28,12 +28,32 @@ from asciidoc_dita_toolkit.modules.example_block import (
 class DualTestRunner:
     """Test runner that supports both deterministic and interactive testing."""
 
+    # Shared by every runner; the detector only holds compiled patterns
+    fixtures_dir = Path('tests/fixtures/ExampleBlock')
+    detector = ExampleBlockDetector()
+
+    # Non-interactive output depends only on the content, so runners share it
+    _deterministic_cache: Dict[str, Tuple[str, List[str]]] = {}
+
     def __init__(self):
-        self.fixtures_dir = Path('tests/fixtures/ExampleBlock')
-        self.detector = ExampleBlockDetector()
         self.passed_tests = 0
         self.failed_tests = 0
         self.test_results = []
+        # Batch mode keeps no per-run state, so one processor serves every fixture
+        self._batch_processor = ExampleBlockProcessor(self.detector, interactive=False)
+        self._fixture_cache: Dict[str, str] = self._read_fixtures()
+
+    def _read_fixtures(self) -> Dict[str, str]:
+        """Read every fixture and expected-output file in one directory scan."""
+        try:
+            with os.scandir(self.fixtures_dir) as entries:
+                return {
+                    entry.name: Path(entry.path).read_text()
+                    for entry in entries
+                    if entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
 
     def run_all_tests(self):
         """Run both deterministic and interactive test suites."""
@@ -95,23 +115,19 @@ class DualTestRunner:
     def _test_deterministic_fixture(self, fixture_name: str):
         """Test a single fixture in deterministic mode."""
         fixture_path = self.fixtures_dir / fixture_name
-        expected_path = (
-            self.fixtures_dir / f"{fixture_name.replace('.adoc', '.expected')}"
-        )
+        expected_name = fixture_name.replace('.adoc', '.expected')
 
-        if not fixture_path.exists():
+        if fixture_name not in self._fixture_cache:
             self._record_test_result(
                 fixture_name, False, f"Fixture not found: {fixture_path}"
             )
             return
 
         try:
-            # Read fixture content
-            content = fixture_path.read_text()
+            content = self._fixture_cache[fixture_name]
 
             # Process with non-interactive mode
-            processor = ExampleBlockProcessor(self.detector, interactive=False)
-            modified_content, issues = processor.process_content(content)
+            modified_content, issues = self._deterministic_output(content)
 
             # Check if this is an ignore fixture (should have no changes)
             if fixture_name.startswith('ignore_'):
@@ -127,8 +143,8 @@ class DualTestRunner:
                     )
             else:
                 # For report fixtures, check if expected file exists
-                if expected_path.exists():
-                    expected_content = expected_path.read_text()
+                if expected_name in self._fixture_cache:
+                    expected_content = self._fixture_cache[expected_name]
                     if modified_content.strip() == expected_content.strip():
                         self._record_test_result(
                             f"{fixture_name} (deterministic)",
@@ -164,32 +180,30 @@ class DualTestRunner:
     def _test_interactive_scenario(self, scenario: Dict[str, Any]):
         """Test a single interactive scenario with mocked input."""
         fixture_name = scenario['fixture']
-        fixture_path = self.fixtures_dir / fixture_name
 
-        if not fixture_path.exists():
+        if fixture_name not in self._fixture_cache:
             self._record_test_result(
                 f"{fixture_name} (interactive)", False, f"Fixture not found"
             )
             return
 
         try:
-            # Read fixture content
-            content = fixture_path.read_text()
+            content = self._fixture_cache[fixture_name]
 
             # Mock both input and print to suppress interactive output
             with mock.patch('builtins.input', side_effect=scenario['user_inputs']):
                 with mock.patch(
                     'builtins.print', side_effect=lambda *args, **kwargs: None
                 ):
-                    # Process with interactive mode
+                    # Process with interactive mode; a fresh processor per run
+                    # so state such as a quit request cannot leak between fixtures
                     processor = ExampleBlockProcessor(self.detector, interactive=True)
                     modified_content, issues = processor.process_content(content)
 
             # Analyze results
-            original_lines = content.splitlines()
-            modified_lines = modified_content.splitlines()
+            modified_lines = modified_content.split('\n')
 
-            moves_detected = self._count_block_movements(original_lines, modified_lines)
+            moves_detected = self._count_block_movements(content, modified_content)
             comments_detected = self._count_guidance_comments(modified_lines)
 
             # For interactive mode, we expect block movements, not just comments
@@ -203,8 +217,7 @@ class DualTestRunner:
                 details.append("No changes made despite interactive input")
             else:
                 # Interactive mode should produce different results than deterministic
-                processor_det = ExampleBlockProcessor(self.detector, interactive=False)
-                det_content, _ = processor_det.process_content(content)
+                det_content, _ = self._deterministic_output(content)
 
                 if modified_content == det_content:
                     success = False
@@ -233,21 +246,23 @@ class DualTestRunner:
                 f"{fixture_name} (interactive)", False, f"Error: {str(e)}"
             )
 
-    def _count_block_movements(
-        self, original_lines: List[str], modified_lines: List[str]
-    ) -> int:
+    def _deterministic_output(self, content: str) -> Tuple[str, List[str]]:
+        """Return the non-interactive result for content, processing it only once."""
+        result = self._deterministic_cache.get(content)
+        if result is None:
+            result = self._batch_processor.process_content(content)
+            self._deterministic_cache[content] = result
+        return result
+
+    def _count_block_movements(self, original_content: str, modified_content: str) -> int:
         """Count how many example blocks were moved to the main body."""
         # Look for blocks that appear in main body in modified but not in original
-        original_main_body = self._extract_main_body(original_lines)
-        modified_main_body = self._extract_main_body(modified_lines)
+        original_main_body = self._extract_main_body(original_content)
+        modified_main_body = self._extract_main_body(modified_content)
 
         # Count example blocks in each
-        original_blocks = self._count_example_blocks_in_text(
-            '\n'.join(original_main_body)
-        )
-        modified_blocks = self._count_example_blocks_in_text(
-            '\n'.join(modified_main_body)
-        )
+        original_blocks = self._count_example_blocks_in_text(original_main_body)
+        modified_blocks = self._count_example_blocks_in_text(modified_main_body)
 
         return max(0, modified_blocks - original_blocks)
 
@@ -259,14 +274,12 @@ class DualTestRunner:
                 count += 1
         return count
 
-    def _extract_main_body(self, lines: List[str]) -> List[str]:
-        """Extract main body lines (before first section header)."""
-        main_body = []
-        for line in lines:
-            if line.startswith('== '):
-                break
-            main_body.append(line)
-        return main_body
+    def _extract_main_body(self, content: str) -> str:
+        """Extract the main body text (before the first section header)."""
+        if content.startswith('== '):
+            return ''
+        idx = content.find('\n== ')
+        return content if idx < 0 else content[:idx]
 
     def _count_example_blocks_in_text(self, text: str) -> int:
         """Count example blocks in text."""
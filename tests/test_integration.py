@@ -1,88 +1,161 @@
-"""Integration tests for ADT module system."""
+"""Integration tests for ADT module system.
+
+Tests share only read-only class state (module instances, config templates
+and the baseline sequencing), so they are safe to run with pytest-xdist.
+Prefer ``make test-parallel``: ``--dist=loadfile`` keeps the class on one
+worker so ``setUpClass`` runs once.
+"""
 
 import json
 import unittest
 import logging
-from unittest.mock import patch, MagicMock
-
-from asciidoc_dita_toolkit.adt_core.module_sequencer import ModuleSequencer, ModuleState
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from asciidoc_dita_toolkit.adt_core.module_sequencer import (
+    ModuleSequencer,
+    ModuleState,
+    _cached_adt_entry_points,
+)
 from asciidoc_dita_toolkit.modules.entity_reference import EntityReferenceModule
 from asciidoc_dita_toolkit.modules.content_type import ContentTypeModule
 from asciidoc_dita_toolkit.modules.directory_config import DirectoryConfigModule
 
 
+def _clone(config):
+    """Return an independent copy of a JSON-shaped config dict."""
+    return json.loads(json.dumps(config))
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests using real modules and configurations."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Configure logging for testing
-        logging.basicConfig(level=logging.DEBUG)
+    # Test-specific configuration that only includes our 3 available modules.
+    # sequence_modules() merges user overrides into the dev config in place,
+    # so each test works on its own copy (see _use_test_configs).
+    DEV_CONFIG_TEMPLATE = {
+        "version": "1.0",
+        "modules": [
+            {
+                "name": "DirectoryConfig",
+                "required": True,
+                "version": "~1.0.0",
+                "dependencies": [],
+                "init_order": 1,
+                "config": {
+                    "scan_depth": 5,
+                    "exclude_patterns": ["*.tmp", "*.log"]
+                }
+            },
+            {
+                "name": "EntityReference",
+                "required": True,
+                "version": ">=1.2.0",
+                "dependencies": ["DirectoryConfig"],
+                "init_order": 2,
+                "config": {
+                    "timeout_seconds": 30,
+                    "cache_size": 1000
+                }
+            },
+            {
+                "name": "ContentType",
+                "required": False,
+                "version": ">=2.0.0",
+                "dependencies": ["EntityReference"],
+                "init_order": 3,
+                "config": {
+                    "cache_enabled": True,
+                    "supported_types": ["text", "image", "video"]
+                }
+            }
+        ],
+        "global_config": {
+            "max_retries": 3,
+            "log_level": "INFO"
+        }
+    }
+
+    USER_CONFIG_TEMPLATE = {
+        "version": "1.0",
+        "enabledModules": ["DirectoryConfig", "EntityReference", "ContentType"],
+        "disabledModules": [],
+        "moduleOverrides": {
+            "ContentType": {
+                "cache_enabled": False,
+                "supported_types": ["text", "image"]
+            }
+        }
+    }
+
+    # Dev config whose only module depends on a module that does not exist.
+    INVALID_DEV_CONFIG = {
+        "version": "1.0",
+        "modules": [
+            {
+                "name": "EntityReference",
+                "required": True,
+                "dependencies": ["NonexistentModule"],
+            }
+        ],
+    }
 
-        self.sequencer = ModuleSequencer()
+    @classmethod
+    def setUpClass(cls):
+        """Create the real module instances once for the whole class."""
+        # Keep the sequencer's per-module debug/info chatter out of the run
+        cls._sequencer_logger = logging.getLogger("adt.sequencer")
+        cls._saved_log_level = cls._sequencer_logger.level
+        cls._sequencer_logger.setLevel(logging.WARNING)
 
         # Manually add real modules (simulating entry point discovery)
-        self.sequencer.available_modules = {
+        cls.real_modules = {
             "EntityReference": EntityReferenceModule(),
             "ContentType": ContentTypeModule(),
             "DirectoryConfig": DirectoryConfigModule(),
         }
 
-        # Create test-specific configuration that only includes our 3 available modules
-        self.test_dev_config = {
-            "version": "1.0",
-            "modules": [
-                {
-                    "name": "DirectoryConfig",
-                    "required": True,
-                    "version": "~1.0.0",
-                    "dependencies": [],
-                    "init_order": 1,
-                    "config": {
-                        "scan_depth": 5,
-                        "exclude_patterns": ["*.tmp", "*.log"]
-                    }
-                },
-                {
-                    "name": "EntityReference",
-                    "required": True,
-                    "version": ">=1.2.0",
-                    "dependencies": ["DirectoryConfig"],
-                    "init_order": 2,
-                    "config": {
-                        "timeout_seconds": 30,
-                        "cache_size": 1000
-                    }
-                },
-                {
-                    "name": "ContentType",
-                    "required": False,
-                    "version": ">=2.0.0",
-                    "dependencies": ["EntityReference"],
-                    "init_order": 3,
-                    "config": {
-                        "cache_enabled": True,
-                        "supported_types": ["text", "image", "video"]
-                    }
-                }
-            ],
-            "global_config": {
-                "max_retries": 3,
-                "log_level": "INFO"
-            }
-        }
+        # Fake entry_points() result that yields the real module classes
+        fake_eps = tuple(
+            SimpleNamespace(name=name, load=lambda mc=module_class: mc)
+            for name, module_class in [
+                ("EntityReference", EntityReferenceModule),
+                ("ContentType", ContentTypeModule),
+                ("DirectoryConfig", DirectoryConfigModule),
+            ]
+        )
+        cls.fake_entry_points = SimpleNamespace(select=lambda group=None: fake_eps)
 
-        self.test_user_config = {
-            "version": "1.0",
-            "enabledModules": ["DirectoryConfig", "EntityReference", "ContentType"],
-            "disabledModules": [],
-            "moduleOverrides": {
-                "ContentType": {
-                    "cache_enabled": False,
-                    "supported_types": ["text", "image"]
-                }
-            }
-        }
+        # Sequence the unmodified test configs once; tests that neither
+        # override nor break the config assert against this result.
+        cls.baseline_resolutions, cls.baseline_errors = (
+            cls._make_fresh_sequencer().sequence_modules()
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the sequencer logger level."""
+        cls._sequencer_logger.setLevel(cls._saved_log_level)
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sequencer = ModuleSequencer()
+        self.sequencer.available_modules = dict(self.real_modules)
+
+    def _use_test_configs(self):
+        """Give self.sequencer its own copy of the test configs."""
+        # Cloned only for tests that sequence them; most tests use the baseline
+        self.sequencer.dev_config = _clone(self.DEV_CONFIG_TEMPLATE)
+        self.sequencer.user_config = _clone(self.USER_CONFIG_TEMPLATE)
+
+    @classmethod
+    def _make_fresh_sequencer(cls):
+        """Return a new sequencer with the shared modules and fresh test configs."""
+        sequencer = ModuleSequencer()
+        sequencer.available_modules = dict(cls.real_modules)
+        sequencer.dev_config = _clone(cls.DEV_CONFIG_TEMPLATE)
+        sequencer.user_config = _clone(cls.USER_CONFIG_TEMPLATE)
+        return sequencer
 
     def test_load_real_configurations(self):
         """Test loading actual configuration files."""
@@ -92,10 +165,13 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(self.sequencer.dev_config["version"], "1.0")
 
         # Verify that essential modules are present instead of hardcoding count
-        loaded_module_names = [m["name"] for m in self.sequencer.dev_config["modules"]]
-        essential_modules = ["DirectoryConfig", "EntityReference", "ContentType", "UserJourney"]
-        for module_name in essential_modules:
-            self.assertIn(module_name, loaded_module_names, f"Essential module {module_name} not found in configuration")
+        loaded_module_names = {m["name"] for m in self.sequencer.dev_config["modules"]}
+        essential_modules = {"DirectoryConfig", "EntityReference", "ContentType", "UserJourney"}
+        self.assertLessEqual(
+            essential_modules,
+            loaded_module_names,
+            f"Essential modules missing from configuration: {essential_modules - loaded_module_names}",
+        )
 
         # Verify we have a reasonable number of modules (at least the essential ones)
         self.assertGreaterEqual(len(self.sequencer.dev_config["modules"]), len(essential_modules))
@@ -103,11 +179,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_full_sequencing_workflow(self):
         """Test complete module sequencing workflow."""
-        # Use test-specific config to avoid dependency issues
-        self.sequencer.dev_config = self.test_dev_config
-        self.sequencer.user_config = self.test_user_config
-
-        resolutions, errors = self.sequencer.sequence_modules()
+        resolutions, errors = self.baseline_resolutions, self.baseline_errors
 
         # Should have no errors
         self.assertEqual(len(errors), 0)
@@ -118,32 +190,20 @@ class TestIntegration(unittest.TestCase):
         test_modules = [r for r in enabled_modules if r.name in ["DirectoryConfig", "EntityReference", "ContentType"]]
         self.assertEqual(len(test_modules), 3)
 
-        module_names = [r.name for r in test_modules]
-        self.assertIn("EntityReference", module_names)
-        self.assertIn("ContentType", module_names)
-        self.assertIn("DirectoryConfig", module_names)  # DirectoryConfig is now required
+        # DirectoryConfig is now required
+        module_names = {r.name for r in test_modules}
+        self.assertEqual(module_names, {"DirectoryConfig", "EntityReference", "ContentType"})
 
         # Verify correct initialization order
-        entity_ref_order = next(
-            r.init_order for r in test_modules if r.name == "EntityReference"
-        )
-        content_type_order = next(
-            r.init_order for r in test_modules if r.name == "ContentType"
-        )
-        self.assertLess(entity_ref_order, content_type_order)
+        orders = {r.name: r.init_order for r in test_modules}
+        self.assertLess(orders["EntityReference"], orders["ContentType"])
 
     def test_module_execution_with_configs(self):
         """Test that modules receive correct configuration."""
-        # Use test-specific config to avoid dependency issues
-        self.sequencer.dev_config = self.test_dev_config
-        self.sequencer.user_config = self.test_user_config
-
-        resolutions, errors = self.sequencer.sequence_modules()
+        resolutions = self.baseline_resolutions
 
         # Find ContentType module resolution
-        content_type_resolution = next(
-            r for r in resolutions if r.name == "ContentType"
-        )
+        content_type_resolution = {r.name: r for r in resolutions}["ContentType"]
 
         # Verify user override applied (cache_enabled should be False)
         self.assertFalse(content_type_resolution.config["cache_enabled"])
@@ -157,8 +217,7 @@ class TestIntegration(unittest.TestCase):
     def test_cli_override_functionality(self):
         """Test CLI overrides work correctly."""
         # Use test-specific config to avoid dependency issues
-        self.sequencer.dev_config = self.test_dev_config
-        self.sequencer.user_config = self.test_user_config
+        self._use_test_configs()
 
         # Test disabling a module via CLI override
         cli_overrides = {"ContentType": False}  # Test disabling ContentType
@@ -168,28 +227,13 @@ class TestIntegration(unittest.TestCase):
 
         # ContentType should be disabled, but DirectoryConfig should be enabled since it's required
         enabled_modules = [r for r in resolutions if r.state == ModuleState.ENABLED]
-        module_names = [r.name for r in enabled_modules]
+        module_names = {r.name for r in enabled_modules}
         self.assertIn("DirectoryConfig", module_names)
         self.assertNotIn("ContentType", module_names)
 
     def test_dependency_resolution_with_real_modules(self):
         """Test dependency resolution using real module dependencies."""
-        # Fresh sequencer instance to avoid test interference
-        fresh_sequencer = ModuleSequencer()
-
-        # Add real modules (simulating entry point discovery)
-        fresh_sequencer.available_modules = {
-            "EntityReference": EntityReferenceModule(),
-            "ContentType": ContentTypeModule(),
-            "DirectoryConfig": DirectoryConfigModule(),
-        }
-
-        # Use test-specific config to avoid dependency issues
-        fresh_sequencer.dev_config = self.test_dev_config
-        fresh_sequencer.user_config = self.test_user_config
-
-        # Sequence modules
-        resolutions, errors = fresh_sequencer.sequence_modules()
+        resolutions, errors = self.baseline_resolutions, self.baseline_errors
 
         # Should have no errors
         self.assertEqual(len(errors), 0)
@@ -209,11 +253,6 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("ContentType", orders, "ContentType should be enabled")
 
         # ContentType depends on EntityReference, so EntityReference should have lower init_order
-        logging.debug(
-            "EntityReference init_order: %s, ContentType init_order: %s",
-            orders["EntityReference"],
-            orders["ContentType"],
-        )
         self.assertLess(
             orders["EntityReference"],
             orders["ContentType"],
@@ -228,8 +267,7 @@ class TestIntegration(unittest.TestCase):
     def test_module_status_reporting(self):
         """Test module status reporting functionality."""
         # Use test-specific config to avoid dependency issues
-        self.sequencer.dev_config = self.test_dev_config
-        self.sequencer.user_config = self.test_user_config
+        self._use_test_configs()
 
         status = self.sequencer.get_module_status()
 
@@ -239,7 +277,7 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("errors", status)
 
         # Should have 3 enabled (only the modules we manually added in setUp), rest should be missing
-        available_test_modules = ["DirectoryConfig", "EntityReference", "ContentType"]
+        available_test_modules = {"DirectoryConfig", "EntityReference", "ContentType"}
         enabled_test_modules = [m for m in status["modules"] if m["name"] in available_test_modules and m["state"] == "enabled"]
         self.assertEqual(len(enabled_test_modules), 3)
         self.assertEqual(len(status["errors"]), 0)
@@ -247,27 +285,14 @@ class TestIntegration(unittest.TestCase):
     def test_configuration_validation(self):
         """Test configuration validation."""
         # Use test-specific config to avoid dependency issues
-        self.sequencer.dev_config = self.test_dev_config
-        self.sequencer.user_config = self.test_user_config
+        self._use_test_configs()
 
         errors = self.sequencer.validate_configuration()
         self.assertEqual(len(errors), 0)  # Should be valid
 
     def test_missing_dependency_error(self):
         """Test error handling when a dependency is missing."""
-        # Create a config that references a non-existent module
-        invalid_config = {
-            "version": "1.0",
-            "modules": [
-                {
-                    "name": "EntityReference",
-                    "required": True,
-                    "dependencies": ["NonexistentModule"],
-                }
-            ],
-        }
-
-        self.sequencer.dev_config = invalid_config
+        self.sequencer.dev_config = _clone(self.INVALID_DEV_CONFIG)
         self.sequencer.user_config = {}
 
         resolutions, errors = self.sequencer.sequence_modules()
@@ -278,31 +303,21 @@ class TestIntegration(unittest.TestCase):
     @patch('asciidoc_dita_toolkit.adt_core.module_sequencer.entry_points')
     def test_module_discovery_integration(self, mock_entry_points):
         """Test module discovery with actual module classes."""
-        # Mock entry points to return our actual modules
-        mock_eps = []
-
-        for name, module_class in [
-            ("EntityReference", EntityReferenceModule),
-            ("ContentType", ContentTypeModule),
-            ("DirectoryConfig", DirectoryConfigModule),
-        ]:
-            mock_ep = MagicMock()
-            mock_ep.name = name
-            mock_ep.load.return_value = module_class
-            mock_eps.append(mock_ep)
-
-        mock_eps_obj = MagicMock()
-        mock_eps_obj.select.return_value = mock_eps
-        mock_entry_points.return_value = mock_eps_obj
+        # Bypass the entry point cache so the mock is seen and not kept
+        _cached_adt_entry_points.cache_clear()
+        self.addCleanup(_cached_adt_entry_points.cache_clear)
+
+        # Entry points that return our actual modules
+        mock_entry_points.return_value = self.fake_entry_points
 
         sequencer = ModuleSequencer()
         sequencer.discover_modules()
 
         # Should have discovered all three modules
-        self.assertEqual(len(sequencer.available_modules), 3)
-        self.assertIn("EntityReference", sequencer.available_modules)
-        self.assertIn("ContentType", sequencer.available_modules)
-        self.assertIn("DirectoryConfig", sequencer.available_modules)
+        self.assertEqual(
+            set(sequencer.available_modules),
+            {"EntityReference", "ContentType", "DirectoryConfig"},
+        )
 
         # Verify actual instances were created
         entity_ref = sequencer.available_modules["EntityReference"]
@@ -315,22 +330,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_end_to_end_module_execution(self):
         """Test the complete flow from discovery through execution."""
-        # Create fresh sequencer to avoid cross-contamination
-        fresh_sequencer = ModuleSequencer()
-
-        # Add real modules (simulating entry point discovery)
-        fresh_sequencer.available_modules = {
-            "EntityReference": EntityReferenceModule(),
-            "ContentType": ContentTypeModule(),
-            "DirectoryConfig": DirectoryConfigModule(),
-        }
-
-        # Use test-specific config to avoid dependency issues
-        fresh_sequencer.dev_config = self.test_dev_config
-        fresh_sequencer.user_config = self.test_user_config
-
-        # Execute the full flow
-        resolutions, errors = fresh_sequencer.sequence_modules()
+        resolutions, errors = self.baseline_resolutions, self.baseline_errors
 
         # Should have no errors
         self.assertEqual(len(errors), 0)
@@ -342,7 +342,7 @@ class TestIntegration(unittest.TestCase):
         # Execute modules in order
         for resolution in enabled_modules:
             # Get module instance from available_modules
-            module = fresh_sequencer.available_modules[resolution.name]
+            module = self.real_modules[resolution.name]
             self.assertIsNotNone(module, f"Module {resolution.name} should have instance")
 
             # Simulate module execution
@@ -1,268 +1,101 @@
 #!/usr/bin/env python3
 """
-Test script to demonstrate Phase 1 and Phase 2 completion.
+Tests for the Phase 1 and Phase 2 module migration.
 
-This script tests:
+These tests cover:
 1. Phase 1: Legacy plugin warning suppression
 2. Phase 2: EntityReference plugin migration to ADTModule pattern
 """
 
-import sys
-import os
-from pathlib import Path
+import unittest
+from unittest.mock import patch
 
-# Add necessary paths
-workspace_root = Path(__file__).parent.parent  # Go up from tests/ to project root
-src_path = workspace_root / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-if str(workspace_root) not in sys.path:
-    sys.path.insert(0, str(workspace_root))
+from asciidoc_dita_toolkit.adt_core.cli import get_new_modules_with_warnings_control
+from asciidoc_dita_toolkit.adt_core.module_sequencer import (
+    ADTModule,
+    LEGACY_PLUGINS,
+    ModuleSequencer,
+)
+from asciidoc_dita_toolkit.modules.entity_reference import (
+    ENTITY_TO_ASCIIDOC,
+    SUPPORTED_ENTITIES,
+    EntityReferenceModule,
+    replace_entities,
+)
 
 
-def test_phase_1_warning_suppression():
-    """Test Phase 1: Legacy plugin warning suppression."""
-    print("=" * 60)
-    print("PHASE 1 TEST: Legacy Plugin Warning Suppression")
-    print("=" * 60)
+class TestMigrationPhases(unittest.TestCase):
+    """Test cases for the legacy warning control and EntityReference migration."""
 
-    try:
-        from asciidoc_dita_toolkit.adt_core.module_sequencer import ModuleSequencer, LEGACY_PLUGINS
-
-        # Test 1: Default behavior (warnings suppressed)
-        print("\n1. Testing default behavior (warnings suppressed):")
+    def test_phase_1_warning_suppression(self):
+        """Test Phase 1: Legacy plugin warnings are suppressed by default and toggleable."""
         sequencer = ModuleSequencer()
-        print(f"   suppress_legacy_warnings: {sequencer.suppress_legacy_warnings}")
-        print(f"   Known legacy plugins: {LEGACY_PLUGINS}")
+        self.assertTrue(sequencer.suppress_legacy_warnings)
+        self.assertIsInstance(LEGACY_PLUGINS, set)
 
-        # Test 2: Warning control methods
-        print("\n2. Testing warning control methods:")
         sequencer.set_suppress_legacy_warnings(False)
-        print(
-            f"   After set_suppress_legacy_warnings(False): {sequencer.suppress_legacy_warnings}"
-        )
+        self.assertFalse(sequencer.suppress_legacy_warnings)
 
         sequencer.set_suppress_legacy_warnings(True)
-        print(
-            f"   After set_suppress_legacy_warnings(True): {sequencer.suppress_legacy_warnings}"
-        )
-
-        print("\n✅ Phase 1 - Warning suppression: PASSED")
-
-    except Exception as e:
-        print(f"\n❌ Phase 1 - Warning suppression: FAILED - {e}")
-        return False
-
-    return True
-
-
-def test_phase_2_entity_reference_migration():
-    """Test Phase 2: EntityReference plugin migration."""
-    print("\n" + "=" * 60)
-    print("PHASE 2 TEST: EntityReference Plugin Migration")
-    print("=" * 60)
-
-    try:
-        from asciidoc_dita_toolkit.modules.entity_reference import (
-            EntityReferenceModule,
-            main,
-            ADT_MODULE_AVAILABLE,
-        )
-
-        # Test 1: ADTModule availability
-        print(f"\n1. ADTModule availability: {ADT_MODULE_AVAILABLE}")
+        self.assertTrue(sequencer.suppress_legacy_warnings)
 
-        # Test 2: EntityReferenceModule instantiation
-        print("\n2. Testing EntityReferenceModule instantiation:")
+    def test_phase_2_entity_reference_migration(self):
+        """Test Phase 2: EntityReference runs through the ADTModule lifecycle."""
         module = EntityReferenceModule()
-        print(f"   Module name: {module.name}")
-        print(f"   Module version: {module.version}")
-        print(f"   Module dependencies: {module.dependencies}")
-        print(f"   Module release status: {module.release_status}")
-
-        # Test 3: Module initialization
-        print("\n3. Testing module initialization:")
-        config = {
-            "verbose": True,
-            "timeout_seconds": 30,
-            "cache_size": 1000,
-            "skip_comments": True,
-        }
-        module.initialize(config)
-        print(f"   Initialized with config: {config}")
-        print(f"   Module verbosity: {module.verbose}")
-        print(f"   Module timeout: {module.timeout_seconds}")
+        self.assertIsInstance(module, ADTModule)
+        self.assertEqual(module.name, "EntityReference")
+        self.assertEqual(module.version, "1.2.1")
+        self.assertEqual(module.dependencies, [])
+        self.assertEqual(module.release_status, "GA")
+
+        module.initialize(
+            {"timeout_seconds": 45, "cache_size": 500, "skip_comments": False}
+        )
+        self.assertEqual(module.timeout_seconds, 45)
+        self.assertEqual(module.cache_size, 500)
+        self.assertFalse(module.skip_comments)
+        self.assertFalse(module.verbose)
 
-        # Test 4: Module execution
-        print("\n4. Testing module execution:")
         context = {"directory": ".", "recursive": False, "file": None, "verbose": False}
         result = module.execute(context)
-        print(f"   Execution result keys: {list(result.keys())}")
-        print(f"   Success: {result.get('success', False)}")
-        print(f"   Files processed: {result.get('files_processed', 0)}")
-        print(f"   Entities replaced: {result.get('entities_replaced', 0)}")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["module_name"], "EntityReference")
+        self.assertIn("files_processed", result)
+        self.assertIn("entities_replaced", result)
 
-        # Test 5: Module cleanup
-        print("\n5. Testing module cleanup:")
         module.cleanup()
-        print("   Cleanup completed successfully")
-
-        # Test 6: Backward compatibility
-        print("\n6. Testing backward compatibility:")
-
-        class MockArgs:
-            def __init__(self):
-                self.verbose = False
-                self.file = None
-                self.recursive = False
-                self.directory = "."
-
-        args = MockArgs()
-        legacy_result = main(args)
-        print(f"   Legacy main() function works: {legacy_result is not None or True}")
-
-        print("\n✅ Phase 2 - EntityReference migration: PASSED")
-
-    except Exception as e:
-        print(f"\n❌ Phase 2 - EntityReference migration: FAILED - {e}")
-        import traceback
-
-        traceback.print_exc()
-        return False
-
-    return True
-
-
-def test_cli_integration():
-    """Test CLI integration with new features."""
-    print("\n" + "=" * 60)
-    print("CLI INTEGRATION TEST")
-    print("=" * 60)
-
-    try:
-        from asciidoc_dita_toolkit.adt_core.cli import (
-            get_new_modules_with_warnings_control,
-            print_plugin_list_with_warnings_control,
-        )
-
-        # Test 1: Module discovery with warning control
-        print("\n1. Testing module discovery with warning control:")
-        modules_suppressed = get_new_modules_with_warnings_control(
-            suppress_warnings=True
-        )
-        print(f"   Modules found (warnings suppressed): {len(modules_suppressed)}")
 
+    def test_cli_integration(self):
+        """Test module discovery with and without legacy warning suppression."""
+        modules_suppressed = get_new_modules_with_warnings_control(suppress_warnings=True)
         modules_shown = get_new_modules_with_warnings_control(suppress_warnings=False)
-        print(f"   Modules found (warnings shown): {len(modules_shown)}")
-
-        print("\n✅ CLI Integration: PASSED")
 
-    except Exception as e:
-        print(f"\n❌ CLI Integration: FAILED - {e}")
-        return False
+        self.assertIsInstance(modules_suppressed, dict)
+        # The warning flag only affects output, not which modules are found
+        self.assertEqual(set(modules_suppressed), set(modules_shown))
 
-    return True
+    def test_entity_replacement_functionality(self):
+        """Test the entity replacement behaviour behind the module."""
+        # Supported entities are left alone
+        text = "This &amp; that &lt; other &gt; thing"
+        self.assertEqual(replace_entities(text), text)
 
-
-def test_entity_replacement_functionality():
-    """Test the actual entity replacement functionality."""
-    print("\n" + "=" * 60)
-    print("ENTITY REPLACEMENT FUNCTIONALITY TEST")
-    print("=" * 60)
-
-    try:
-        from asciidoc_dita_toolkit.modules.entity_reference import (
-            replace_entities,
-            ENTITY_TO_ASCIIDOC,
-            SUPPORTED_ENTITIES,
+        # Replaceable entities become attribute references
+        self.assertEqual(
+            replace_entities("Copyright &copy; 2023 &mdash; All rights reserved &trade;"),
+            "Copyright {copy} 2023 {mdash} All rights reserved {trade}",
         )
 
-        # Test 1: Supported entities (should not be replaced)
-        print("\n1. Testing supported entities (should not be replaced):")
-        test_line = "This &amp; that &lt; other &gt; thing"
-        result = replace_entities(test_line)
-        print(f"   Input: {test_line}")
-        print(f"   Output: {result}")
-        print(f"   Unchanged: {test_line == result}")
-
-        # Test 2: Replaceable entities
-        print("\n2. Testing replaceable entities:")
-        test_line = "Copyright &copy; 2023 &mdash; All rights reserved &trade;"
-        result = replace_entities(test_line)
-        print(f"   Input: {test_line}")
-        print(f"   Output: {result}")
-        print(f"   Changed: {test_line != result}")
-
-        # Test 3: Unknown entities (should generate warnings)
-        print("\n3. Testing unknown entities:")
-        test_line = "Unknown &fakeentity; should warn"
-        result = replace_entities(test_line)
-        print(f"   Input: {test_line}")
-        print(f"   Output: {result}")
-
-        # Test 4: Entity mapping statistics
-        print("\n4. Entity mapping statistics:")
-        print(f"   Supported entities: {len(SUPPORTED_ENTITIES)}")
-        print(f"   Replaceable entities: {len(ENTITY_TO_ASCIIDOC)}")
-        print(f"   Sample supported: {list(SUPPORTED_ENTITIES)[:3]}")
-        print(f"   Sample replaceable: {list(ENTITY_TO_ASCIIDOC.keys())[:3]}")
-
-        print("\n✅ Entity Replacement Functionality: PASSED")
-
-    except Exception as e:
-        print(f"\n❌ Entity Replacement Functionality: FAILED - {e}")
-        return False
-
-    return True
-
-
-def main():
-    """Run all tests."""
-    print("ADT MODULE MIGRATION - PHASE 1 & 2 COMPLETION TEST")
-    print("=" * 60)
-
-    tests = [
-        test_phase_1_warning_suppression,
-        test_phase_2_entity_reference_migration,
-        test_cli_integration,
-        test_entity_replacement_functionality,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"Test {test.__name__} failed with exception: {e}")
-            failed += 1
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("FINAL SUMMARY")
-    print("=" * 60)
-    print(f"Tests passed: {passed}")
-    print(f"Tests failed: {failed}")
-    print(f"Total tests: {passed + failed}")
-
-    if failed == 0:
-        print("\n🎉 ALL TESTS PASSED! Phase 1 & 2 implementation is complete.")
-        print("\nKey achievements:")
-        print("✅ Legacy plugin warnings suppressed with configurable control")
-        print("✅ EntityReference plugin migrated to ADTModule pattern")
-        print("✅ Complete backward compatibility maintained")
-        print("✅ Enhanced developer experience and documentation")
-        print("✅ Solid foundation for remaining plugin migrations")
-    else:
-        print(f"\n❌ {failed} test(s) failed. Please review the output above.")
+        # Unknown entities warn and stay unchanged
+        with patch("builtins.print") as mock_print:
+            result = replace_entities("Unknown &fakeentity; should warn")
+        mock_print.assert_called_with("Warning: No AsciiDoc attribute for &fakeentity;")
+        self.assertEqual(result, "Unknown &fakeentity; should warn")
 
-    return failed == 0
+        # Both entity tables are populated
+        self.assertIn("amp", SUPPORTED_ENTITIES)
+        self.assertEqual(ENTITY_TO_ASCIIDOC["copy"], "{copy}")
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    unittest.main()
@@ -7,6 +7,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from asciidoc_dita_toolkit.adt_core.module_sequencer import (
+    _cached_adt_entry_points,
     ModuleSequencer,
     ADTModule,
     ModuleState,
@@ -85,6 +86,12 @@ class TestModuleSequencer(unittest.TestCase):
         self.sequencer.dev_config = self.dev_config
         self.sequencer.user_config = self.user_config
 
+    def _assert_order(self, names, *expected):
+        """Assert that ``expected`` appear in ``names`` in the given order."""
+        rank = {name: i for i, name in enumerate(names)}
+        for earlier, later in zip(expected, expected[1:]):
+            self.assertLess(rank[earlier], rank[later], f"{earlier} should precede {later}")
+
     def test_load_configurations_success(self):
         """Test successful configuration loading."""
         with tempfile.NamedTemporaryFile(
@@ -171,8 +178,14 @@ class TestModuleSequencer(unittest.TestCase):
         result = self.sequencer._topological_sort(graph)
 
         # A should come before B, B should come before C
-        self.assertTrue(result.index("A") < result.index("B"))
-        self.assertTrue(result.index("B") < result.index("C"))
+        self._assert_order(result, "A", "B", "C")
+
+    def test_topological_sort_cycle(self):
+        """Test that topological sorting rejects a cyclic graph."""
+        graph = {"A": {"B"}, "B": {"C"}, "C": {"B"}}
+
+        with self.assertRaises(CircularDependencyError):
+            self.sequencer._topological_sort(graph)
 
     def test_apply_user_preferences_required_module(self):
         """Test that required modules cannot be disabled by user."""
@@ -223,7 +236,18 @@ class TestModuleSequencer(unittest.TestCase):
         module_names = [r.name for r in resolutions]
         self.assertIn("ModuleA", module_names)
         self.assertIn("ModuleB", module_names)
-        self.assertTrue(module_names.index("ModuleA") < module_names.index("ModuleB"))
+        self._assert_order(module_names, "ModuleA", "ModuleB")
+
+    def test_sequence_modules_circular_dependency(self):
+        """Test that sequencing reports the path of a dependency cycle."""
+        self.dev_config["modules"][0]["dependencies"] = ["ModuleC"]
+
+        resolutions, errors = self.sequencer.sequence_modules()
+
+        self.assertEqual(resolutions, [])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Circular dependency detected", errors[0])
+        self.assertIn(" -> ", errors[0])
 
     def test_get_module_status(self):
         """Test getting module status."""
@@ -248,6 +272,10 @@ class TestModuleSequencer(unittest.TestCase):
     @patch('asciidoc_dita_toolkit.adt_core.module_sequencer.entry_points')
     def test_discover_modules(self, mock_entry_points):
         """Test module discovery via entry points."""
+        # Bypass the entry point cache so the mock is seen and not kept
+        _cached_adt_entry_points.cache_clear()
+        self.addCleanup(_cached_adt_entry_points.cache_clear)
+
         # Mock entry points
         mock_ep = MagicMock()
         mock_ep.name = "TestModule"
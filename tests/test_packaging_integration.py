@@ -19,11 +19,72 @@ import subprocess
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
 import importlib.util
 
 
+@pytest.fixture(scope="session")
+def build_wheel(tmp_path_factory):
+    """Build the wheel once per session and return its path.
+
+    Building is the slowest step of this suite; tests only read the wheel.
+    """
+    build_dir = tmp_path_factory.mktemp("wheel-build")
+
+    # Get the project root (assuming tests are in project_root/tests/)
+    project_root = Path(__file__).parent.parent
+
+    # Build the wheel
+    result = subprocess.run([
+        sys.executable, "-m", "build", "--wheel", "--outdir", str(build_dir)
+    ], cwd=project_root, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        error_msg = f"Wheel build failed: {result.stderr}"
+        if "No module named 'build'" in result.stderr:
+            error_msg += "\n\nTo install build dependencies, run: pip install build"
+        pytest.fail(error_msg)
+
+    # Find the wheel file
+    wheel_files = list(build_dir.glob("*.whl"))
+    if not wheel_files:
+        pytest.fail("No wheel file was created")
+
+    return wheel_files[0]
+
+
+@pytest.fixture(scope="session")
+def installed_venv(build_wheel, tmp_path_factory):
+    """Create one virtual environment with the wheel installed for the session.
+
+    Returns a (venv_dir, python_exe) tuple; tests only run commands in it.
+    """
+    venv_dir = tmp_path_factory.mktemp("wheel-venv") / "test_venv"
+
+    # Create a virtual environment
+    subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
+
+    # Determine python executable in venv
+    if sys.platform == "win32":
+        python_exe = venv_dir / "Scripts" / "python.exe"
+        pip_exe = venv_dir / "Scripts" / "pip.exe"
+    else:
+        python_exe = venv_dir / "bin" / "python"
+        pip_exe = venv_dir / "bin" / "pip"
+
+    # Install the wheel
+    result = subprocess.run([
+        str(pip_exe), "install", str(build_wheel)
+    ], capture_output=True, text=True)
+
+    if result.returncode != 0:
+        pytest.fail(f"Wheel installation failed: {result.stderr}")
+
+    return venv_dir, python_exe
+
+
 @pytest.mark.integration
 @pytest.mark.slow
 class TestPackagingIntegration:
@@ -100,73 +161,46 @@ except Exception as e:
     sys.exit(1)
 '''
 
-    @pytest.fixture
-    def build_wheel(self, tmp_path):
-        """Build a wheel in a temporary directory and return its path."""
-        # Create a temporary build directory
-        build_dir = tmp_path / "build"
-        build_dir.mkdir()
-
-        # Get the project root (assuming tests are in project_root/tests/)
-        project_root = Path(__file__).parent.parent
-
-        # Build the wheel
-        result = subprocess.run([
-            sys.executable, "-m", "build", "--wheel", "--outdir", str(build_dir)
-        ], cwd=project_root, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            error_msg = f"Wheel build failed: {result.stderr}"
-            if "No module named 'build'" in result.stderr:
-                error_msg += "\n\nTo install build dependencies, run: pip install build"
-            pytest.fail(error_msg)
-
-        # Find the wheel file
-        wheel_files = list(build_dir.glob("*.whl"))
-        if not wheel_files:
-            pytest.fail("No wheel file was created")
-
-        return wheel_files[0]
-
     def test_wheel_contains_required_modules(self, build_wheel, notify_user):
         """Test that the wheel contains both asciidoc_dita_toolkit and modules packages."""
         notify_user.notify_slow_test_start("Analyzing wheel contents", 8)
         wheel_path = build_wheel
 
         with zipfile.ZipFile(wheel_path, 'r') as wheel:
-            file_list = wheel.namelist()
+            # Collect the file set and top-level directories in one pass
+            file_set = set()
+            top_level_dirs = set()
+            has_modules_package = False
+            for file_path in wheel.namelist():
+                file_set.add(file_path)
+                top_level_dir, sep, _ = file_path.partition('/')
+                if sep:
+                    top_level_dirs.add(top_level_dir)
+                if not has_modules_package and file_path.startswith('asciidoc_dita_toolkit/modules/'):
+                    has_modules_package = True
 
             # Check for asciidoc_dita_toolkit package
-            asciidoc_dita_files = [f for f in file_list if f.startswith('asciidoc_dita_toolkit/')]
-            assert asciidoc_dita_files, "asciidoc_dita_toolkit package not found in wheel"
+            assert 'asciidoc_dita_toolkit' in top_level_dirs, "asciidoc_dita_toolkit package not found in wheel"
 
             # Check for modules package under asciidoc_dita_toolkit (new v2.1.0+ structure)
-            modules_files = [f for f in file_list if f.startswith('asciidoc_dita_toolkit/modules/')]
-            assert modules_files, "asciidoc_dita_toolkit.modules package not found in wheel - refactoring failed!"
+            assert has_modules_package, "asciidoc_dita_toolkit.modules package not found in wheel - refactoring failed!"
 
             # Verify specific critical files in the new structure
-            expected_files = [
+            expected_files = {
                 'asciidoc_dita_toolkit/__init__.py',
                 'asciidoc_dita_toolkit/adt_core/__init__.py',
                 'asciidoc_dita_toolkit/modules/__init__.py',
                 'asciidoc_dita_toolkit/modules/content_type/__init__.py',
                 'asciidoc_dita_toolkit/modules/entity_reference/__init__.py',
-            ]
+            }
 
-            for expected_file in expected_files:
-                assert expected_file in file_list, f"Critical file {expected_file} missing from wheel"
+            missing_files = expected_files - file_set
+            assert not missing_files, f"Critical files missing from wheel: {sorted(missing_files)}"
 
-            # Specifically check that we have BOTH modules/ and asciidoc_dita_toolkit/ at top level
+            # Specifically check the top-level layout
             # This is the key test - in v2.0.11, modules/ was missing from top level
-            top_level_dirs = set()
-            for file_path in file_list:
-                if '/' in file_path:
-                    top_level_dir = file_path.split('/')[0]
-                    top_level_dirs.add(top_level_dir)
-
             # After v2.1.0 refactoring, we should NOT have top-level 'modules' directory
             assert 'modules' not in top_level_dirs, "Top-level 'modules' directory should be removed after refactoring"
-            assert 'asciidoc_dita_toolkit' in top_level_dirs, "Top-level 'asciidoc_dita_toolkit' directory missing from wheel"
 
     def test_entry_points_defined_correctly(self, build_wheel, notify_user):
         """Test that all entry points are properly defined in the wheel metadata."""
@@ -199,30 +233,10 @@ except Exception as e:
             for plugin in expected_plugins:
                 assert plugin in entry_points_content, f"Plugin entry point '{plugin}' not found in metadata"
 
-    def test_fresh_install_and_import(self, build_wheel, tmp_path, notify_user):
+    def test_fresh_install_and_import(self, installed_venv, notify_user):
         """Test installing the wheel in a clean environment and importing modules."""
         notify_user.notify_slow_test_start("Setting up clean environment and testing imports", 12)
-        wheel_path = build_wheel
-        venv_dir = tmp_path / "test_venv"
-
-        # Create a virtual environment
-        subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
-
-        # Determine python executable in venv
-        if sys.platform == "win32":
-            python_exe = venv_dir / "Scripts" / "python.exe"
-            pip_exe = venv_dir / "Scripts" / "pip.exe"
-        else:
-            python_exe = venv_dir / "bin" / "python"
-            pip_exe = venv_dir / "bin" / "pip"
-
-        # Install the wheel
-        result = subprocess.run([
-            str(pip_exe), "install", str(wheel_path)
-        ], capture_output=True, text=True)
-
-        if result.returncode != 0:
-            pytest.fail(f"Wheel installation failed: {result.stderr}")
+        _, python_exe = installed_venv
 
         # Test importing the main package
         import_test_script = self._get_import_test_script()
@@ -239,72 +253,49 @@ except Exception as e:
         assert "SUCCESS: asciidoc_dita_toolkit.modules.entity_reference imported" in result.stdout
         assert "SUCCESS: asciidoc_dita_toolkit.modules.content_type imported" in result.stdout
 
-    def test_cli_commands_accessible(self, build_wheel, tmp_path, notify_user):
+    def test_cli_commands_accessible(self, installed_venv, notify_user):
         """Test that CLI commands are accessible after installation."""
         notify_user.notify_slow_test_start("Testing CLI command accessibility", 10)
-        wheel_path = build_wheel
-        venv_dir = tmp_path / "test_venv"
-
-        # Create and setup virtual environment (reuse logic from previous test)
-        subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
-
-        if sys.platform == "win32":
-            python_exe = venv_dir / "Scripts" / "python.exe"
-            pip_exe = venv_dir / "Scripts" / "pip.exe"
-        else:
-            python_exe = venv_dir / "bin" / "python"
-            pip_exe = venv_dir / "bin" / "pip"
-
-        # Install the wheel
-        subprocess.run([str(pip_exe), "install", str(wheel_path)], check=True)
+        venv_dir, python_exe = installed_venv
 
-        # Test CLI commands
-        cli_commands = ['adt', 'adg', 'valeflag']
-
-        for cmd in cli_commands:
-            # Test that the command exists and shows help (should not crash)
-            result = subprocess.run([
-                str(python_exe), "-m", "pip", "show", "-f", "asciidoc-dita-toolkit"
-            ], capture_output=True, text=True)
-
-            # The command should be listed in the installed files
-            assert result.returncode == 0, f"Package info retrieval failed"
+        # The package info is the same for every command, so fetch it once
+        result = subprocess.run([
+            str(python_exe), "-m", "pip", "show", "-f", "asciidoc-dita-toolkit"
+        ], capture_output=True, text=True)
+        assert result.returncode == 0, f"Package info retrieval failed"
 
-            # More direct test: try to run the command with --help
+        def run_help(cmd):
+            """Run ``cmd --help`` if installed; return (cmd, returncode, stderr)."""
             if sys.platform == "win32":
                 cmd_exe = venv_dir / "Scripts" / f"{cmd}.exe"
             else:
                 cmd_exe = venv_dir / "bin" / cmd
 
             # Check if command executable exists
-            if cmd_exe.exists():
-                # Try running with --help (should not crash due to missing modules)
-                result = subprocess.run([
-                    str(cmd_exe), "--help"
-                ], capture_output=True, text=True, timeout=10)
-
-                # Command should either succeed or fail gracefully (not with ModuleNotFoundError)
-                if result.returncode != 0:
-                    assert "No module named 'modules'" not in result.stderr, \
-                        f"CLI command '{cmd}' failed with module import error: {result.stderr}"
-
-    def test_plugin_discovery_works(self, build_wheel, tmp_path, notify_user):
-        """Test that plugin entry points can be discovered and loaded."""
-        notify_user.notify_slow_test_start("Testing plugin discovery and loading", 9)
-        wheel_path = build_wheel
-        venv_dir = tmp_path / "test_venv"
+            if not cmd_exe.exists():
+                return cmd, None, ""
 
-        # Setup venv and install wheel
-        subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
+            # Try running with --help (should not crash due to missing modules)
+            result = subprocess.run([
+                str(cmd_exe), "--help"
+            ], capture_output=True, text=True, timeout=10)
+            return cmd, result.returncode, result.stderr
 
-        if sys.platform == "win32":
-            python_exe = venv_dir / "Scripts" / "python.exe"
-            pip_exe = venv_dir / "Scripts" / "pip.exe"
-        else:
-            python_exe = venv_dir / "bin" / "python"
-            pip_exe = venv_dir / "bin" / "pip"
+        # Test CLI commands; each is a separate process, so run them concurrently
+        cli_commands = ['adt', 'adg', 'valeflag']
+        with ThreadPoolExecutor(max_workers=len(cli_commands)) as executor:
+            results = list(executor.map(run_help, cli_commands))
 
-        subprocess.run([str(pip_exe), "install", str(wheel_path)], check=True)
+        for cmd, returncode, stderr in results:
+            # Command should either succeed or fail gracefully (not with ModuleNotFoundError)
+            if returncode:
+                assert "No module named 'modules'" not in stderr, \
+                    f"CLI command '{cmd}' failed with module import error: {stderr}"
+
+    def test_plugin_discovery_works(self, installed_venv, notify_user):
+        """Test that plugin entry points can be discovered and loaded."""
+        notify_user.notify_slow_test_start("Testing plugin discovery and loading", 9)
+        _, python_exe = installed_venv
 
         # Test plugin discovery
         plugin_test_script = self._get_plugin_discovery_script()
@@ -29,6 +29,7 @@ try:
         LINK_PATTERN,
         CONTEXT_ATTR_PATTERN,
         INCLUDE_PATTERN,
+        ID_OR_INCLUDE_PATTERN,
         PATTERN_EXAMPLES,
     )
 except ImportError as e:
@@ -51,6 +52,7 @@ class TestCompiledPatterns(unittest.TestCase):
         self.assertIsNotNone(CompiledPatterns.LINK_REGEX)
         self.assertIsNotNone(CompiledPatterns.CONTEXT_ATTR_REGEX)
         self.assertIsNotNone(CompiledPatterns.INCLUDE_REGEX)
+        self.assertIsNotNone(CompiledPatterns.ID_OR_INCLUDE_REGEX)
 
     def test_patterns_are_compiled(self):
         """Test that patterns are actually compiled regex objects."""
@@ -63,6 +65,7 @@ class TestCompiledPatterns(unittest.TestCase):
         self.assertIsInstance(CompiledPatterns.LINK_REGEX, re.Pattern)
         self.assertIsInstance(CompiledPatterns.CONTEXT_ATTR_REGEX, re.Pattern)
         self.assertIsInstance(CompiledPatterns.INCLUDE_REGEX, re.Pattern)
+        self.assertIsInstance(CompiledPatterns.ID_OR_INCLUDE_REGEX, re.Pattern)
 
 
 @unittest.skipIf(
@@ -337,6 +340,26 @@ class TestUtilityFunctions(unittest.TestCase):
         empty_doc = get_pattern_documentation('NON_EXISTENT')
         self.assertEqual(empty_doc, {})
 
+    def test_id_or_include_pattern(self):
+        """Test the combined ID-or-include pattern captures."""
+        test_cases = [
+            ('[id="topic"]', ('topic', None)),
+            ('== Heading [id="inline_id"]', ('inline_id', None)),
+            ('include::chapter1.adoc[]', (None, 'chapter1.adoc')),
+            ('include::modules/procedure.adoc[]', (None, 'modules/procedure.adoc')),
+        ]
+
+        for input_text, expected_groups in test_cases:
+            with self.subTest(input_text=input_text):
+                match = CompiledPatterns.ID_OR_INCLUDE_REGEX.search(input_text)
+                self.assertIsNotNone(match, f"Pattern should match: {input_text}")
+                self.assertEqual(match.groups(), expected_groups)
+
+        for input_text in ['id="missing_brackets"', 'include::file.adoc[tag=part]']:
+            with self.subTest(input_text=input_text):
+                match = CompiledPatterns.ID_OR_INCLUDE_REGEX.search(input_text)
+                self.assertIsNone(match, f"Pattern should not match: {input_text}")
+
     def test_list_available_patterns(self):
         """Test listing available patterns."""
         patterns = list_available_patterns()